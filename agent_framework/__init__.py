@@ -4,21 +4,46 @@
 the Model Context Protocol (MCP).
 """
 
+import importlib
+
 __version__ = "0.1.0"
 
-# Core components
-from .core.agent import Agent
-from .core.config import AgentConfig, load_config
-from .core.events import EventStream, EventType, AgentEvent
-from .core.logging import AgentLogger
+# Public components are imported lazily on first attribute access (PEP 562),
+# so lightweight entry points such as the CLI don't pay for MCP/LLM imports.
+_LAZY = {
+    # Core components
+    "Agent": ".core.agent",
+    "AgentConfig": ".core.config",
+    "load_config": ".core.config",
+    "EventStream": ".core.events",
+    "EventType": ".core.events",
+    "AgentEvent": ".core.events",
+    "AgentLogger": ".core.logging",
+    
+    # Network components
+    "AgentSupervisor": ".network.supervisor",
+    "AgentRegistry": ".network.registry",
+    
+    # MCP components
+    "UniversalAgentMCPServer": ".mcp.server_universal",
+    "AgentMCPClient": ".mcp.client",
+}
+
+
+def __getattr__(name):
+    """Import public components on first access."""
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value  # Cache so later lookups skip __getattr__
+    return value
+
 
-# Network components
-from .network.supervisor import AgentSupervisor
-from .network.registry import AgentRegistry
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY))
 
-# MCP components
-from .mcp.server_universal import UniversalAgentMCPServer
-from .mcp.client import AgentMCPClient
 
 __all__ = [
     # Core
@@ -10,53 +10,505 @@
 
 import click
 import asyncio
-import json
-import yaml
+import array
+import struct
 from pathlib import Path
 from typing import List, Optional
 import sys
 import os
+import select
 import signal
 import atexit
-import psutil
+import copy
 import time
+from contextlib import contextmanager
+from functools import lru_cache
 
-from ..core.config import load_config, AgentConfig
-from ..network.supervisor import AgentSupervisor
-from ..network.registry import AgentRegistry
+from ..core.serialization import dumps_pretty, loads
 from ..client.socket_client import AgentSocketClient
 
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+
 
 # Global state file to track running agents
 STATE_FILE = Path.home() / ".chaotic-af" / "agents.json"
+STATE_LOCK_FILE = STATE_FILE.with_suffix(".lock")
+
+# Commands that modify and save the state file
+STATE_WRITERS = {'start', 'stop', 'status', 'restart', 'remove'}
+
+
+# Event loop shared by every async step of a CLI invocation
+_LOOP = None
+
+
+def _run(coro):
+    """Run a coroutine to completion on the CLI's shared event loop.
+    
+    Reusing one loop avoids building and tearing down a loop and selector
+    for every asyncio call (e.g. restart runs one per agent).
+    """
+    global _LOOP
+    if _LOOP is None or _LOOP.is_closed():
+        _LOOP = asyncio.new_event_loop()
+    return _LOOP.run_until_complete(coro)
+
+
+@atexit.register
+def _close_loop():
+    """Close the shared event loop at interpreter exit."""
+    if _LOOP is not None and not _LOOP.is_closed():
+        _LOOP.run_until_complete(AgentSocketClient.close_all())
+        _LOOP.run_until_complete(_LOOP.shutdown_asyncgens())
+        _LOOP.close()
+
+
+@contextmanager
+def state_lock():
+    """Hold an exclusive lock on the state file for a read-modify-write.
+    
+    Serializes concurrent agentctl invocations so one can't overwrite the
+    other's changes. A no-op where fcntl is unavailable (Windows).
+    """
+    if fcntl is None:
+        yield
+        return
+    
+    STATE_LOCK_FILE.parent.mkdir(parents=True, exist_ok=True)
+    with open(STATE_LOCK_FILE, 'a') as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock, fcntl.LOCK_UN)
 
 
 def load_state():
     """Load agent state from file."""
-    if STATE_FILE.exists():
-        with open(STATE_FILE, 'r') as f:
-            return json.load(f)
-    return {"agents": {}}
+    try:
+        return loads(STATE_FILE.read_bytes())
+    except FileNotFoundError:
+        return {"agents": {}}
 
 
 def save_state(state):
-    """Save agent state to file."""
+    """Save agent state to file.
+    
+    Writes a temporary file and renames it over the state file, so an
+    interrupted write never leaves a truncated agents.json behind.
+    """
     STATE_FILE.parent.mkdir(parents=True, exist_ok=True)
-    with open(STATE_FILE, 'w') as f:
-        json.dump(state, f, indent=2)
+    tmp_file = STATE_FILE.with_suffix(".json.tmp")
+    tmp_file.write_bytes(dumps_pretty(state))
+    os.replace(tmp_file, STATE_FILE)
+
+
+# ANSI sequences used by `watch` to redraw in place
+CURSOR_HOME = "\x1b[H"
+CLEAR_EOL = "\x1b[K"
+CLEAR_EOS = "\x1b[J"
+
+# Styled table cells for `status` and `watch`; they never change, so
+# they are built once
+STATUS_CELLS = {
+    'running': click.style('running ✓', fg='green'),
+    'starting': click.style('starting', fg='yellow'),
+    'failed': click.style('failed', fg='red'),
+    'stopped': click.style('stopped', fg='red'),
+}
+RUNNING_DOT = click.style('●', fg='green')
+STOPPED_DOT = click.style('●', fg='red')
+HEALTHY_CELL = click.style('healthy', fg='green')
+UNHEALTHY_CELL = click.style('unhealthy', fg='red')
+
+
+# Seconds an agent gets to exit after SIGTERM before it is killed
+STOP_TIMEOUT = 5.0
+
+# Seconds a health result is reused before the agent is probed again. The
+# cache lives only as long as the CLI process, so it helps long-running
+# commands (watch); kept below watch's smallest interval so each regular
+# tick still probes afresh.
+HEALTH_TTL = 0.5
+
+# Recent health replies per agent name, as (time.monotonic(), result)
+_health_cache = {}
+
+
+# Module every agent process is launched with (see AgentSupervisor.start_agent)
+AGENT_RUNNER_MODULE = 'agent_framework.network.agent_runner'
+
+
+def _is_agent_process(pid: int) -> bool:
+    """Check that a PID from state still belongs to an agent runner.
+    
+    On Linux this is a single read of /proc/<pid>/cmdline, which guards
+    against signalling an unrelated process that reused the PID. Where
+    /proc is unavailable only that one PID is looked up through psutil.
+    """
+    try:
+        with open(f"/proc/{pid}/cmdline", 'rb') as f:
+            return AGENT_RUNNER_MODULE.encode() in f.read()
+    except FileNotFoundError:
+        # No such PID - unless there is no /proc at all
+        if os.path.isdir('/proc'):
+            return False
+    except OSError:
+        return True
+    
+    import psutil
+    
+    try:
+        return AGENT_RUNNER_MODULE in ' '.join(psutil.Process(pid).cmdline())
+    except psutil.NoSuchProcess:
+        return False
+    except psutil.AccessDenied:
+        return True
+
+
+# `logs -f` re-stats the log at least this often (ms), so rotation is
+# noticed even if the watcher misses the event for it
+FOLLOW_RECHECK_MS = 1000
+
 
+class _INotifyWatcher:
+    """Blocking change notifications for one file via inotify."""
+    
+    def __init__(self, path: Path):
+        from inotify_simple import INotify, flags
+        self._inotify = INotify()
+        try:
+            # ATTRIB fires when the link count drops, i.e. the file was
+            # unlinked: DELETE_SELF waits for the last open handle, ours
+            self._inotify.add_watch(
+                str(path),
+                flags.MODIFY | flags.ATTRIB | flags.MOVE_SELF | flags.DELETE_SELF
+            )
+        except OSError:
+            self._inotify.close()
+            raise
+    
+    def read(self):
+        return self._inotify.read(timeout=FOLLOW_RECHECK_MS)
+    
+    def close(self):
+        self._inotify.close()
 
-def cleanup_agents_on_exit():
-    """Clean up any running agent processes on exit."""
+
+class _FileWatcher:
+    """Blocking change notifications for one file via watchfiles."""
+    
+    def __init__(self, path: Path):
+        import watchfiles
+        self._changes = watchfiles.watch(
+            str(path), rust_timeout=FOLLOW_RECHECK_MS, yield_on_timeout=True
+        )
+    
+    def read(self):
+        return next(self._changes)
+    
+    def close(self):
+        self._changes.close()
+
+
+def _watch_log_file(log_file: Path):
+    """Watch a log file for appended data.
+    
+    Returns an object whose read() blocks until the file changes (or is
+    moved or unlinked by log rotation), or for at most FOLLOW_RECHECK_MS:
+    inotify on Linux, watchfiles elsewhere. Returns None when neither is
+    available and the caller should fall back to polling.
+    """
+    # Watchers import their libraries lazily so only `logs -f` pays for them
+    try:
+        return _INotifyWatcher(log_file)
+    except (ImportError, OSError):
+        pass
+    try:
+        return _FileWatcher(log_file)
+    except Exception:
+        # watchfiles missing, or it can't watch this file
+        return None
+
+
+def _tail_lines(path: Path, n: int, needle: Optional[bytes] = None,
+               block_size: int = 65536) -> List[str]:
+    """Return the last n lines of a file, like `tail -n`.
+    
+    Reads backwards from EOF in blocks, so the cost depends on the size of
+    the tail rather than the whole file. If needle is given, only lines
+    containing it are kept (and counted towards n).
+    """
+    if n <= 0:
+        return []
+    
+    found = []  # Newest first
+    with open(path, 'rb') as f:
+        pos = f.seek(0, os.SEEK_END)
+        partial = b''  # Start of a line whose beginning is in an earlier block
+        at_eof = True
+        
+        while pos > 0 and len(found) < n:
+            step = min(block_size, pos)
+            pos -= step
+            f.seek(pos)
+            parts = (f.read(step) + partial).split(b'\n')
+            
+            # Unless at the start of the file, the first piece may continue
+            # in the previous block
+            if pos > 0:
+                partial = parts.pop(0)
+            
+            # Text after the final newline is not a line of its own
+            if at_eof and parts and parts[-1] == b'':
+                parts.pop()
+            at_eof = False
+            
+            for raw in reversed(parts):
+                if needle is None or needle in raw:
+                    found.append(raw)
+                    if len(found) >= n:
+                        break
+    
+    return [raw.decode('utf-8', errors='replace') for raw in reversed(found)]
+
+
+# Sidecar index header: inode and byte size of the log covered so far, and
+# the number of offsets that follow
+_LOG_INDEX_HEADER = struct.Struct('<QQQ')
+
+
+def _indexed_tail_lines(path: Path, n: int, agent_name: str) -> List[str]:
+    """Return an agent's last n lines from the shared supervisor log.
+    
+    The byte offsets of the agent's lines are kept in a sidecar file
+    (.supervisor.log.<agent>.idx), so each call only scans what was
+    appended since the last one and then seeks straight to the lines it
+    needs. The index is rebuilt if the log was rotated or truncated.
+    """
+    if n <= 0:
+        return []
+    
+    needle = f"[{agent_name}]".encode()
+    index_file = path.parent / f".{path.name}.{agent_name}.idx"
+    offsets = array.array('Q')
+    
+    with open(path, 'rb') as f:
+        st = os.fstat(f.fileno())
+        scanned = 0
+        
+        try:
+            data = index_file.read_bytes()
+            inode, size, count = _LOG_INDEX_HEADER.unpack_from(data)
+            body = data[_LOG_INDEX_HEADER.size:]
+            # Only trust a complete index for this file
+            if (inode == st.st_ino and size <= st.st_size
+                    and len(body) == count * offsets.itemsize):
+                offsets.frombytes(body)
+                if offsets and offsets[-1] >= size:
+                    offsets = array.array('Q')
+                else:
+                    scanned = size
+        except (OSError, struct.error, ValueError):
+            pass
+        
+        # The last indexed line must still be ours, or the file was replaced
+        if offsets:
+            f.seek(offsets[-1])
+            if needle not in f.readline():
+                offsets = array.array('Q')
+                scanned = 0
+        
+        # Index the complete lines appended since the last scan
+        f.seek(scanned)
+        for raw in f:
+            if not raw.endswith(b'\n'):
+                break  # Still being written; picked up next time
+            if needle in raw:
+                offsets.append(scanned)
+            scanned += len(raw)
+        
+        found = []
+        for offset in offsets[-n:]:
+            f.seek(offset)
+            found.append(f.readline().rstrip(b'\n').decode('utf-8', errors='replace'))
+        
+        # An unfinished last line isn't indexed yet, but belongs in the output
+        f.seek(scanned)
+        rest = f.readline()
+        if needle in rest:
+            found = (found + [rest.decode('utf-8', errors='replace')])[-n:]
+    
+    # Written aside and renamed into place, like save_state, so overlapping
+    # or interrupted runs never leave a torn index behind
+    tmp_file = index_file.with_name(f"{index_file.name}.{os.getpid()}.tmp")
+    try:
+        tmp_file.write_bytes(
+            _LOG_INDEX_HEADER.pack(st.st_ino, scanned, len(offsets)) + offsets.tobytes()
+        )
+        os.replace(tmp_file, index_file)
+    except OSError:
+        pass  # Read-only log directory - just rescan next time
+    
+    return found
+
+
+def _live_pids():
+    """Snapshot the set of live PIDs with a single /proc listing.
+    
+    Returns None where /proc is unavailable (non-Linux).
+    """
+    try:
+        return {int(p) for p in os.listdir('/proc') if p.isdigit()}
+    except OSError:
+        return None
+
+
+def _pid_alive(pid: int, live_pids=None) -> bool:
+    """Check if a process exists, using a /proc snapshot when available."""
+    if live_pids is not None:
+        return pid in live_pids
+    try:
+        os.kill(pid, 0)  # Signal 0 = check if process exists
+        return True
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+
+
+async def _cached_health(agent_name: str, timeout: float, ttl: float = HEALTH_TTL) -> dict:
+    """Health-check an agent, reusing a reply younger than `ttl` seconds."""
+    now = time.monotonic()
+    cached = _health_cache.get(agent_name)
+    if cached and now - cached[0] < ttl:
+        return cached[1]
+    result = await AgentSocketClient.health_check(agent_name, timeout=timeout)
+    _health_cache[agent_name] = (now, result)
+    return result
+
+
+def _wait_for_exit_pidfd(pids: List[int], timeout: float) -> Optional[List[int]]:
+    """Wait for exits with one poll() over pidfds (Linux 5.3+).
+    
+    Returns None where pidfds are unsupported.
+    """
+    if not hasattr(os, 'pidfd_open'):
+        return None
+    
+    poller = select.poll()
+    fds = {}
+    try:
+        for pid in pids:
+            try:
+                fd = os.pidfd_open(pid)
+            except ProcessLookupError:
+                continue  # Already gone
+            except OSError:
+                return None
+            fds[fd] = pid
+            poller.register(fd, select.POLLIN)
+        
+        deadline = time.monotonic() + timeout
+        while fds:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            for fd, _ in poller.poll(remaining * 1000):
+                # A pidfd turns readable once its process has exited
+                poller.unregister(fd)
+                os.close(fd)
+                del fds[fd]
+        return list(fds.values())
+    finally:
+        for fd in fds:
+            os.close(fd)
+
+
+def _wait_for_exit(pids: List[int], timeout: float = STOP_TIMEOUT) -> List[int]:
+    """Wait for processes to exit, all at once rather than one by one.
+    
+    Returns the PIDs still running after the timeout.
+    """
+    alive = _wait_for_exit_pidfd(pids, timeout)
+    if alive is not None:
+        return alive
+    
+    import psutil
+    
+    procs = []
+    for pid in pids:
+        try:
+            procs.append(psutil.Process(pid))
+        except psutil.NoSuchProcess:
+            pass
+    _, alive = psutil.wait_procs(procs, timeout=timeout)
+    return [proc.pid for proc in alive]
+
+
+def _force_kill(pid: int):
+    """SIGKILL a process that ignored SIGTERM."""
+    try:
+        os.kill(pid, signal.SIGKILL)
+    except (ProcessLookupError, PermissionError):
+        pass
+
+
+def _deep_cleanup():
+    """Terminate every agent runner process on the host, tracked or not.
+    
+    On Linux this reads /proc/<pid>/cmdline directly (one read per process);
+    elsewhere it falls back to psutil.
+    """
+    if os.path.isdir('/proc'):
+        needle = AGENT_RUNNER_MODULE.encode()
+        for entry in Path('/proc').iterdir():
+            if not entry.name.isdigit() or int(entry.name) == os.getpid():
+                continue
+            try:
+                cmdline = (entry / 'cmdline').read_bytes()
+            except OSError:
+                continue
+            if needle in cmdline:
+                try:
+                    os.kill(int(entry.name), signal.SIGTERM)
+                except (ProcessLookupError, PermissionError):
+                    pass
+        return
+    
+    import psutil
+    
+    for proc in psutil.process_iter(['pid', 'name', 'cmdline']):
+        try:
+            cmdline = proc.info.get('cmdline', [])
+            if cmdline and AGENT_RUNNER_MODULE in ' '.join(cmdline):
+                proc.terminate()
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            pass
+
+
+def cleanup_agents_on_exit(deep: bool = False):
+    """Clean up agent processes on exit.
+    
+    Only the PIDs recorded in the state file are signalled. Pass deep=True
+    to additionally scan the whole process table for stray agent runners.
+    """
     try:
-        # Kill any agent_framework.network.agent_runner processes
-        for proc in psutil.process_iter(['pid', 'name', 'cmdline']):
+        for info in load_state().get('agents', {}).values():
+            pid = info.get('pid')
+            if not pid or not _is_agent_process(pid):
+                continue
             try:
-                cmdline = proc.info.get('cmdline', [])
-                if cmdline and 'agent_framework.network.agent_runner' in ' '.join(cmdline):
-                    proc.terminate()
-            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                os.kill(pid, signal.SIGTERM)
+            except (ProcessLookupError, PermissionError):
                 pass
+        
+        if deep:
+            _deep_cleanup()
     except Exception:
         pass
 
@@ -67,13 +519,61 @@ def cli(ctx):
     """Chaotic AF - Manage multi-agent systems with ease."""
     ctx.ensure_object(dict)
     ctx.obj['state'] = load_state()
+    
+    # Read-only commands never flush, so only writers need the snapshot
+    if ctx.invoked_subcommand in STATE_WRITERS:
+        ctx.obj['state_loaded'] = copy.deepcopy(ctx.obj['state'])
+
+
+def _merge_agent_changes(current, before, after):
+    """Apply the agent entries that changed from before to after onto current.
+    
+    Only the fields a command actually changed are written, so updates
+    another agentctl made to the file in the meantime are kept.
+    """
+    agents = current['agents']
+    for name in before['agents'].keys() | after['agents'].keys():
+        old = before['agents'].get(name)
+        new = after['agents'].get(name)
+        if new == old:
+            continue
+        if new is None:
+            agents.pop(name, None)
+        elif old is None:
+            agents[name] = copy.deepcopy(new)
+        elif name in agents:  # Stays gone if another command removed it
+            for key in old.keys() | new.keys():
+                if key not in new:
+                    agents[name].pop(key, None)
+                elif new[key] != old.get(key):
+                    agents[name][key] = copy.deepcopy(new[key])
+
+
+def flush_state(ctx):
+    """Save the command's state only if it changed since it was loaded.
+    
+    The lock is held just for re-reading the file, merging this command's
+    changes in and writing it back, not across the command's socket probes
+    and waits.
+    """
+    state = ctx.obj['state']
+    loaded = ctx.obj.get('state_loaded')
+    if state == loaded:
+        return
+    
+    with state_lock():
+        current = load_state()
+        _merge_agent_changes(current, loaded or {"agents": {}}, state)
+        save_state(current)
+    ctx.obj['state_loaded'] = copy.deepcopy(state)
 
 
 @cli.command()
 @click.argument('config_files', nargs=-1, required=True, type=click.Path(exists=True))
 @click.option('--connect-all', '-c', is_flag=True, help='Connect all agents bidirectionally')
+@click.option('--no-config-cache', is_flag=True, help='Always re-parse YAML configs (skip the parsed-config cache)')
 @click.pass_context
-def start(ctx, config_files: tuple, connect_all: bool):
+def start(ctx, config_files: tuple, connect_all: bool, no_config_cache: bool):
     """Start agent(s) from configuration file(s).
     
     Examples:
@@ -81,6 +581,10 @@ def start(ctx, config_files: tuple, connect_all: bool):
         agentctl start agent1.yaml agent2.yaml agent3.yaml --connect-all
         agentctl start *.yaml -c  # Start all configs and connect them
     """
+    from concurrent.futures import ThreadPoolExecutor
+    from ..core.config import load_config
+    from ..network.supervisor import AgentSupervisor
+    
     state = ctx.obj['state']
     
     # Don't register cleanup - agents run independently
@@ -89,17 +593,24 @@ def start(ctx, config_files: tuple, connect_all: bool):
     # Create new supervisor for this batch
     supervisor = AgentSupervisor()
     
-    # Load configurations
-    configs = []
-    for config_file in config_files:
+    # Load configurations - parse files concurrently, register them in order
+    def load_one(config_file):
         try:
-            config = load_config(config_file)
-            configs.append(config)
-            supervisor.add_agent(config)
-            click.echo(f"✓ Loaded configuration for agent '{config.name}'")
+            return load_config(config_file, use_cache=not no_config_cache), None
         except Exception as e:
-            click.echo(f"✗ Failed to load {config_file}: {str(e)}", err=True)
+            return None, e
+    
+    with ThreadPoolExecutor(max_workers=min(8, len(config_files))) as executor:
+        loaded = list(executor.map(load_one, config_files))
+    
+    configs = []
+    for config_file, (config, error) in zip(config_files, loaded):
+        if error is not None:
+            click.echo(f"✗ Failed to load {config_file}: {str(error)}", err=True)
             sys.exit(1)
+        configs.append(config)
+        supervisor.add_agent(config)
+        click.echo(f"✓ Loaded configuration for agent '{config.name}'")
     
     # Start agents in non-blocking mode
     async def start_agents():
@@ -119,14 +630,14 @@ async def start_agents():
                     'started_at': time.time()  # Track when agent was started
                 }
         
-        save_state(state)
+        flush_state(ctx)
         
         # Connections will be handled separately after agents are ready
         # We don't do it here to avoid blocking
     
     # Always run in non-blocking mode
     try:
-        asyncio.run(start_agents())
+        _run(start_agents())
         
         # Show what's happening
         click.echo(f"\n✓ Starting {len(configs)} agent(s)...")
@@ -145,18 +656,21 @@ async def start_agents():
 
 @cli.command()
 @click.argument('agent_names', nargs=-1)
+@click.option('--deep-clean', is_flag=True, help='Also terminate untracked agent processes on this host')
 @click.pass_context
-def stop(ctx, agent_names: tuple):
+def stop(ctx, agent_names: tuple, deep_clean: bool):
     """Stop agent(s).
     
     Examples:
         agentctl stop              # Stop all agents
         agentctl stop agent1       # Stop specific agent
         agentctl stop agent1 agent2
+        agentctl stop --deep-clean # Also kill stray agent processes
     """
     state = ctx.obj['state']
     
     agents_to_stop = agent_names if agent_names else list(state['agents'].keys())
+    signalled = {}
     
     for name in agents_to_stop:
         if name in state['agents']:
@@ -167,18 +681,30 @@ def stop(ctx, agent_names: tuple):
                 # Send SIGTERM to gracefully stop
                 os.kill(pid, signal.SIGTERM)
                 click.echo(f"✓ Sent stop signal to agent '{name}' (PID: {pid})")
+                signalled[pid] = name
                 
                 # Remove from state
                 del state['agents'][name]
+                _health_cache.pop(name, None)
             except ProcessLookupError:
                 click.echo(f"⚠ Agent '{name}' (PID: {pid}) not found - may have already stopped")
                 del state['agents'][name]
+                _health_cache.pop(name, None)
             except Exception as e:
                 click.echo(f"✗ Failed to stop agent '{name}': {str(e)}", err=True)
         else:
             click.echo(f"⚠ Agent '{name}' not found in running agents")
     
-    save_state(state)
+    flush_state(ctx)
+    
+    # All agents shut down in parallel; wait for them together
+    for pid in _wait_for_exit(list(signalled)):
+        _force_kill(pid)
+        click.echo(f"⚠ Agent '{signalled[pid]}' (PID: {pid}) did not exit in time - killed")
+    
+    if deep_clean:
+        _deep_cleanup()
+        click.echo("✓ Terminated any untracked agent processes")
 
 
 @cli.command()
@@ -191,63 +717,46 @@ def status(ctx):
         click.echo("No agents are currently running.")
         return
     
-    # Header
-    click.echo("\nAgent Status:")
-    click.echo("-" * 65)
-    click.echo(f"{'Name':<15} {'PID':<8} {'Port':<6} {'Status':<20} {'Info':<15}")
-    click.echo("-" * 65)
+    # One /proc listing covers the liveness check for every agent, taken
+    # only once some agent fails to answer on its socket
+    live_pids = None
     
     # Check each agent
     async def check_agent_status(name, info):
+        nonlocal live_pids
         pid = info['pid']
         port = info['port']
         
-        # First check if process is still running
-        try:
-            os.kill(pid, 0)  # Signal 0 = check if process exists
+        # Ask the socket first - a reply already proves the process is alive
+        result = await _cached_health(name, timeout=1.0)
+        
+        if result.get('status') == 'ready':
+            # Socket responded - agent is running
+            status = 'running'
+            status_display = STATUS_CELLS['running']
+            info_text = ""
+        
+        else:
+            if live_pids is None:
+                live_pids = _live_pids()
             
-            # Process is alive, check socket to determine if starting or running
-            socket_path = f"/tmp/chaotic-af/agent-{name}.sock"
-            if os.path.exists(socket_path):
-                try:
-                    # Use AgentSocketClient for health check
-                    result = await AgentSocketClient.health_check(name, timeout=1.0)
-                    
-                    if result.get('status') == 'ready':
-                        # Socket responded - agent is running
-                        status = 'running'
-                        status_display = click.style('running ✓', fg='green')
-                        info_text = ""
-                    else:
-                        # Got response but not ready
-                        status = 'starting'
-                        elapsed = int(time.time() - info.get('started_at', time.time()))
-                        status_display = click.style('starting', fg='yellow')
-                        info_text = f"({elapsed}s ago)"
-                except Exception as e:
-                    # Socket exists but not responding - still starting
-                    status = 'starting'
-                    elapsed = int(time.time() - info.get('started_at', time.time()))
-                    status_display = click.style('starting', fg='yellow')
-                    info_text = f"({elapsed}s ago)"
-            else:
-                # No socket yet - still starting
+            if _pid_alive(pid, live_pids):
+                # No socket yet, or not ready - still starting
                 status = 'starting'
                 elapsed = int(time.time() - info.get('started_at', time.time()))
-                status_display = click.style('starting', fg='yellow')
+                status_display = STATUS_CELLS['starting']
                 info_text = f"({elapsed}s ago)"
-                
-        except ProcessLookupError:
+            
             # Process is dead
-            if info.get('status') == 'starting':
+            elif info.get('status') == 'starting':
                 # Was starting but died - failed to start
                 status = 'failed'
-                status_display = click.style('failed', fg='red')
+                status_display = STATUS_CELLS['failed']
                 info_text = "Failed to start"
             else:
                 # Was running but died - stopped
                 status = 'stopped'
-                status_display = click.style('stopped', fg='red')
+                status_display = STATUS_CELLS['stopped']
                 info_text = ""
         
         # Update state
@@ -263,14 +772,22 @@ async def check_all():
         return await asyncio.gather(*tasks)
     
     # Get all statuses
-    results = asyncio.run(check_all())
+    results = _run(check_all())
     
-    # Display results
+    # Build the table, then write it in one go
+    lines = [
+        "\nAgent Status:",
+        "-" * 65,
+        f"{'Name':<15} {'PID':<8} {'Port':<6} {'Status':<20} {'Info':<15}",
+        "-" * 65,
+    ]
     for name, pid, port, status_display, info_text in results:
-        click.echo(f"{name:<15} {pid:<8} {port:<6} {status_display:<20} {info_text:<15}")
+        lines.append(f"{name:<15} {pid:<8} {port:<6} {status_display:<20} {info_text:<15}")
+    lines.append("-" * 65)
+    click.echo("\n".join(lines))
     
-    click.echo("-" * 65)
-    save_state(state)
+    # Only rewrites the state file if some agent's status flipped
+    flush_state(ctx)
 
 
 @cli.command()
@@ -294,57 +811,75 @@ def logs(agent_name: str, follow: bool, lines: int):
             click.echo(f"No log file found for agent '{agent_name}'")
             return
     
+    # Filter lines for this agent if using supervisor.log
+    needle = f"[{agent_name}]".encode() if log_file.name == "supervisor.log" else None
+    
+    def tail():
+        if needle is None:
+            return _tail_lines(log_file, lines)
+        return _indexed_tail_lines(log_file, lines, agent_name)
+    
     if follow:
         # Follow mode - like tail -f
         click.echo(f"Following logs for '{agent_name}' (Ctrl+C to stop)...")
         
         try:
             # Show last N lines first
-            with open(log_file, 'r') as f:
-                all_lines = f.readlines()
-                # Filter lines for this agent if using supervisor.log
-                if log_file.name == "supervisor.log":
-                    agent_lines = [l for l in all_lines if f"[{agent_name}]" in l]
-                else:
-                    agent_lines = all_lines
-                
-                for line in agent_lines[-lines:]:
-                    click.echo(line.rstrip())
+            for line in tail():
+                click.echo(line.rstrip())
             
-            # Then follow new lines
-            with open(log_file, 'r') as f:
+            # Then follow new lines. Watch before seeking so no write is missed.
+            watcher = _watch_log_file(log_file)
+            f = open(log_file, 'rb')
+            try:
                 # Go to end
                 f.seek(0, 2)
                 
                 while True:
-                    line = f.readline()
-                    if line:
-                        # Filter for agent if using supervisor.log
-                        if log_file.name == "supervisor.log":
-                            if f"[{agent_name}]" in line:
-                                click.echo(line.rstrip())
-                        else:
-                            click.echo(line.rstrip())
+                    raw = f.readline()
+                    if raw:
+                        # Only decode lines that pass the agent filter
+                        if needle is None or needle in raw:
+                            click.echo(raw.rstrip().decode('utf-8', errors='replace'))
+                        continue
+                    
+                    # At EOF - check whether the log was rotated or truncated
+                    try:
+                        st = os.stat(log_file)
+                    except FileNotFoundError:
+                        # Moved away and not recreated yet
+                        time.sleep(0.1)
+                        continue
+                    
+                    if st.st_ino != os.fstat(f.fileno()).st_ino:
+                        # Rotated: the old file is drained, follow the new one
+                        f.close()
+                        f = open(log_file, 'rb')
+                        if watcher:
+                            watcher.close()
+                            watcher = _watch_log_file(log_file)
+                    elif st.st_size < f.tell():
+                        # Truncated in place
+                        f.seek(0)
+                    elif watcher:
+                        # Block until the file changes or it's time to
+                        # re-stat the path
+                        watcher.read()
                     else:
                         # No new line, sleep briefly
-                        import time
                         time.sleep(0.1)
+            finally:
+                f.close()
+                if watcher:
+                    watcher.close()
         
         except KeyboardInterrupt:
             click.echo("\nStopped following logs.")
     
     else:
         # Just show last N lines
-        with open(log_file, 'r') as f:
-            all_lines = f.readlines()
-            # Filter lines for this agent if using supervisor.log
-            if log_file.name == "supervisor.log":
-                agent_lines = [l for l in all_lines if f"[{agent_name}]" in l]
-            else:
-                agent_lines = all_lines
-                
-            for line in agent_lines[-lines:]:
-                click.echo(line.rstrip())
+        for line in tail():
+            click.echo(line.rstrip())
 
 
 @cli.command()
@@ -374,16 +909,30 @@ def connect(ctx, from_agent: str, to_agent: str, bidirectional: bool):
     to_info = state['agents'][to_agent]
     
     # Send CONNECT command via socket
-    import json
+    async def send_connect(src: str, dst: str, dst_port: int) -> dict:
+        """Ask src's socket to connect to dst."""
+        return await AgentSocketClient.connect_agents(
+            src, dst, f'http://localhost:{dst_port}/mcp'
+        )
     
     async def do_connect():
-        """Execute the connection via socket."""
-        # Connect from_agent -> to_agent
-        result = await AgentSocketClient.connect_agents(
-            from_agent, to_agent,
-            f'http://localhost:{to_info["port"]}/mcp'
-        )
+        """Execute the connection(s) via socket."""
+        # from_agent -> to_agent, plus the reverse direction if bidirectional
+        directions = [(from_agent, to_agent, to_info["port"])]
+        if bidirectional:
+            directions.append((to_agent, from_agent, from_info["port"]))
+        
+        # Each direction talks to a different agent socket, so send them
+        # concurrently
+        results = await asyncio.gather(*[
+            send_connect(src, dst, port) for src, dst, port in directions
+        ], return_exceptions=True)
+        results = [
+            {'error': str(r)} if isinstance(r, BaseException) else r
+            for r in results
+        ]
         
+        result = results[0]
         if result.get('status') == 'connected':
             click.echo(f"✓ Connected: {from_agent} → {to_agent}")
         else:
@@ -392,11 +941,7 @@ async def do_connect():
             
         # Bidirectional connection
         if bidirectional:
-            result = await AgentSocketClient.connect_agents(
-                to_agent, from_agent,
-                f'http://localhost:{from_info["port"]}/mcp'
-            )
-            
+            result = results[1]
             if result.get('status') == 'connected':
                 click.echo(f"✓ Connected: {to_agent} → {from_agent}")
             else:
@@ -405,7 +950,7 @@ async def do_connect():
         return True
     
     # Run the async connection
-    asyncio.run(do_connect())
+    _run(do_connect())
 
 
 @cli.command()
@@ -424,7 +969,8 @@ def health(ctx, agent_name: str):
         return
     
     async def check_health():
-        result = await AgentSocketClient.health_check(agent_name, timeout=5.0)
+        # An explicit health check always probes the agent
+        result = await _cached_health(agent_name, timeout=5.0, ttl=0)
         
         if result.get('error'):
             if 'Timeout' in result['error']:
@@ -438,7 +984,7 @@ async def check_health():
         else:
             click.echo(f"✗ Agent '{agent_name}' is not healthy", err=True)
     
-    asyncio.run(check_health())
+    _run(check_health())
 
 
 @cli.command()
@@ -469,14 +1015,14 @@ async def get_metrics():
         elif 'metrics' in result:
             if format == 'json':
                 # Pretty print JSON
-                click.echo(json.dumps(result['metrics'], indent=2))
+                click.echo(dumps_pretty(result['metrics']).decode())
             else:
                 # Prometheus format
                 click.echo(result['metrics'])
         else:
             click.echo(f"✗ Failed to get metrics", err=True)
     
-    asyncio.run(get_metrics())
+    _run(get_metrics())
 
 
 @cli.command()
@@ -490,57 +1036,72 @@ def restart(ctx, agent_names: tuple):
         agentctl restart alice        # Restart specific agent
         agentctl restart alice bob
     """
-    state = ctx.obj['state']
+    from ..core.config import load_config
+    from ..network.supervisor import AgentSupervisor
     
-    agents_to_restart = agent_names if agent_names else list(state['agents'].keys())
+    state = ctx.obj['state']
     
-    for name in agents_to_restart:
+    agents_to_restart = []
+    for name in (agent_names or list(state['agents'].keys())):
         if name not in state['agents']:
             click.echo(f"⚠ Agent '{name}' not found")
             continue
-            
-        agent_info = state['agents'][name]
-        pid = agent_info['pid']
-        config_file = agent_info['config_file']
-        
-        # First stop the agent
+        agents_to_restart.append(name)
+    
+    # Phase 1: signal every agent, then wait for all of them at once so
+    # the shutdown grace periods overlap instead of adding up
+    stopping = {}
+    for name in list(agents_to_restart):
+        pid = state['agents'][name]['pid']
         try:
             os.kill(pid, signal.SIGTERM)
             click.echo(f"✓ Stopping agent '{name}' (PID: {pid})")
-            
-            # Wait a moment for graceful shutdown
-            import time
-            time.sleep(2)
-            
+            stopping[pid] = name
+            _health_cache.pop(name, None)
         except ProcessLookupError:
             click.echo(f"⚠ Agent '{name}' already stopped")
         except Exception as e:
             click.echo(f"✗ Failed to stop agent '{name}': {str(e)}", err=True)
-            continue
-        
-        # Start the agent again
+            agents_to_restart.remove(name)
+    
+    # Wait for the graceful shutdowns to finish, so the ports are free
+    if stopping:
+        for pid in _wait_for_exit(list(stopping)):
+            _force_kill(pid)
+    
+    if not agents_to_restart:
+        flush_state(ctx)
+        return
+    
+    # Phase 2: one supervisor starts every agent concurrently
+    supervisor = AgentSupervisor()
+    for name in list(agents_to_restart):
         try:
-            config = load_config(config_file)
-            supervisor = AgentSupervisor()
-            supervisor.add_agent(config)
-            
-            async def restart_agent():
-                await supervisor.start_agent(name, monitor_output=False)
-                
-                # Update state with new PID
-                agent_proc = supervisor.agents.get(name)
-                if agent_proc and agent_proc.status == "running":
-                    state['agents'][name]['pid'] = agent_proc.pid
-                    click.echo(f"✓ Restarted agent '{name}' (new PID: {agent_proc.pid})")
-                else:
-                    click.echo(f"✗ Failed to restart agent '{name}'", err=True)
-            
-            asyncio.run(restart_agent())
-            
+            supervisor.add_agent(load_config(state['agents'][name]['config_file']))
         except Exception as e:
             click.echo(f"✗ Failed to restart agent '{name}': {str(e)}", err=True)
+            agents_to_restart.remove(name)
+    
+    async def restart_agents():
+        return await asyncio.gather(*[
+            supervisor.start_agent(name, monitor_output=False)
+            for name in agents_to_restart
+        ], return_exceptions=True)
     
-    save_state(state)
+    results = _run(restart_agents()) if agents_to_restart else []
+    
+    for name, result in zip(agents_to_restart, results):
+        # Update state with new PID
+        agent_proc = supervisor.agents.get(name)
+        if isinstance(result, BaseException):
+            click.echo(f"✗ Failed to restart agent '{name}': {str(result)}", err=True)
+        elif agent_proc and agent_proc.status == "running":
+            state['agents'][name]['pid'] = agent_proc.pid
+            click.echo(f"✓ Restarted agent '{name}' (new PID: {agent_proc.pid})")
+        else:
+            click.echo(f"✗ Failed to restart agent '{name}'", err=True)
+    
+    flush_state(ctx)
 
 
 @cli.command()
@@ -553,74 +1114,149 @@ def watch(ctx, interval: int):
         agentctl watch
         agentctl watch -i 5  # Update every 5 seconds
     """
+    import psutil
+    
     state = ctx.obj['state']
     
     if not state['agents']:
         click.echo("No agents are currently running.")
         return
     
+    # A process's start time never changes, so look it up once per PID
+    start_times = {}
+    
+    # Styled cells are the same every tick, so build them once
+    title = click.style("Chaotic AF - Agent Monitor", fg='cyan', bold=True)
+    legend = f"Legend: {RUNNING_DOT} Running  {STOPPED_DOT} Stopped"
+    
     async def watch_agents():
         """Continuously monitor agent status."""
+        loop = asyncio.get_running_loop()
+        
+        # Agents aren't children of this process, so there is no SIGCHLD.
+        # A pidfd (Linux 5.3+) becomes readable when its process exits,
+        # which lets a death redraw the table immediately.
+        exit_fds = {}
+        exited = set()
+        wake = asyncio.Event()
+        
+        def on_exit(pid):
+            fd = exit_fds.pop(pid)
+            loop.remove_reader(fd)
+            os.close(fd)
+            exited.add(pid)
+            wake.set()
+        
+        def watch_exit(pid):
+            if pid in exit_fds or not hasattr(os, 'pidfd_open'):
+                return
+            try:
+                fd = os.pidfd_open(pid)
+            except OSError:
+                return
+            exit_fds[pid] = fd
+            loop.add_reader(fd, on_exit, pid)
+        
         try:
+            # Blank the screen once; later frames overwrite it in place
+            click.clear()
+            
             while True:
-                # Clear screen
-                click.clear()
-                
-                # Header
-                click.echo(click.style("Chaotic AF - Agent Monitor", fg='cyan', bold=True))
-                click.echo(f"Updated: {click.style(time.strftime('%Y-%m-%d %H:%M:%S'), fg='green')}")
-                click.echo("Press Ctrl+C to exit\n")
-                
-                # Table header
-                click.echo(f"{'Name':<15} {'PID':<8} {'Port':<6} {'Health':<10} {'Uptime':<15} {'Connections':<12}")
-                click.echo("-" * 80)
-                
-                # Check each agent
+                # Liveness first - a dead agent needs no socket round trip
+                rows = {}
                 for name, info in state['agents'].items():
                     pid = info['pid']
-                    port = info['port']
                     
                     # Check process status
                     try:
-                        proc = psutil.Process(pid)
-                        status = click.style('●', fg='green')
+                        # A PID with an exit watch is alive until it fires;
+                        # the rest cost one kill(pid, 0) each
+                        if pid in exited or (pid not in exit_fds and not _pid_alive(pid)):
+                            raise psutil.NoSuchProcess(pid)
+                        
+                        create_time = start_times.get(pid)
+                        if create_time is None:
+                            create_time = start_times[pid] = psutil.Process(pid).create_time()
+                            watch_exit(pid)
                         
                         # Calculate uptime
-                        create_time = proc.create_time()
                         uptime_seconds = time.time() - create_time
                         hours = int(uptime_seconds // 3600)
                         minutes = int((uptime_seconds % 3600) // 60)
                         seconds = int(uptime_seconds % 60)
-                        uptime = f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+                        rows[name] = (True, f"{hours:02d}:{minutes:02d}:{seconds:02d}")
                         
                     except psutil.NoSuchProcess:
-                        status = click.style('●', fg='red')
-                        uptime = "N/A"
+                        start_times.pop(pid, None)
+                        rows[name] = (False, "N/A")
+                
+                # Probe the live agents' sockets concurrently
+                live = [name for name, (alive, _) in rows.items() if alive]
+                healthy = await asyncio.gather(*[
+                    check_agent_health(name) for name in live
+                ], return_exceptions=True)
+                health_results = dict(zip(live, healthy))
+                
+                # Build the whole frame, then write it in one go
+                lines = []
+                
+                # Header
+                lines.append(title)
+                lines.append(f"Updated: {click.style(time.strftime('%Y-%m-%d %H:%M:%S'), fg='green')}")
+                lines.append("Press Ctrl+C to exit")
+                lines.append("")
+                
+                # Table header
+                lines.append(f"{'Name':<15} {'PID':<8} {'Port':<6} {'Health':<10} {'Uptime':<15} {'Connections':<12}")
+                lines.append("-" * 80)
+                
+                for name, info in state['agents'].items():
+                    alive, uptime = rows[name]
+                    status = RUNNING_DOT if alive else STOPPED_DOT
                     
-                    # Check health via socket
-                    health = await check_agent_health(name)
-                    health_status = click.style('healthy', fg='green') if health else click.style('unhealthy', fg='red')
+                    health = health_results.get(name) is True
+                    health_status = HEALTHY_CELL if health else UNHEALTHY_CELL
                     
                     # Get connection count (placeholder - would need metrics)
                     connections = "N/A"
                     
-                    click.echo(f"{name:<15} {pid:<8} {port:<6} {status} {health_status:<10} {uptime:<15} {connections:<12}")
+                    lines.append(f"{name:<15} {info['pid']:<8} {info['port']:<6} {status} {health_status:<10} {uptime:<15} {connections:<12}")
                 
-                click.echo("-" * 80)
-                click.echo(f"\nLegend: {click.style('●', fg='green')} Running  {click.style('●', fg='red')} Stopped")
+                lines.append("-" * 80)
+                lines.append("")
+                lines.append(legend)
                 
-                # Wait for next update
-                await asyncio.sleep(interval)
+                # Cursor home, clear the rest of each row (a previous frame
+                # may have had longer content) and anything below the table
+                frame = CURSOR_HOME + "".join(line + CLEAR_EOL + "\n" for line in lines) + CLEAR_EOS
+                click.echo(frame, nl=False)
+                sys.stdout.flush()
+                
+                # Wait for next update, or until an agent exits
+                try:
+                    await asyncio.wait_for(wake.wait(), timeout=interval)
+                except asyncio.TimeoutError:
+                    pass
+                wake.clear()
                 
         except KeyboardInterrupt:
             click.echo("\n\nExiting monitor...")
+        finally:
+            for fd in exit_fds.values():
+                loop.remove_reader(fd)
+                os.close(fd)
     
     async def check_agent_health(agent_name: str) -> bool:
-        """Quick health check for an agent."""
-        result = await AgentSocketClient.health_check(agent_name, timeout=1.0)
+        """Quick health check for an agent.
+        
+        Results are reused for half an interval, so an early redraw (an
+        agent exited) doesn't re-probe every other agent, but every regular
+        tick does.
+        """
+        result = await _cached_health(agent_name, timeout=1.0, ttl=min(HEALTH_TTL, interval / 2))
         return result.get('status') == 'ready'
     
-    asyncio.run(watch_agents())
+    _run(watch_agents())
 
 
 @cli.command()
@@ -678,7 +1314,7 @@ def remove(ctx, agent_names: tuple, stopped: bool, failed: bool, all: bool):
         return
     
     if removed:
-        save_state(state)
+        flush_state(ctx)
         click.echo(f"✓ Removed {len(removed)} agent(s) from state:")
         for name in removed:
             click.echo(f"  • {name}")
@@ -686,16 +1322,77 @@ def remove(ctx, agent_names: tuple, stopped: bool, failed: bool, all: bool):
         click.echo("No agents removed.")
 
 
+@lru_cache(maxsize=None)
+def _styled_name(name: str, color: str) -> str:
+    """Bold, coloured agent name for chat output, styled once per name."""
+    return click.style(name, fg=color, bold=True)
+
+
+@lru_cache(maxsize=None)
+def _thinking_line(agent_id: str) -> str:
+    return click.style(f"[{agent_id} thinking...]", fg='yellow')
+
+
+def _preview(text: str, limit: int = 80) -> str:
+    """Shorten a message for one-line display."""
+    return text[:limit] + '...' if len(text) > limit else text
+
+
+def _is_agent_tool(tool_name: str) -> bool:
+    # Covers the per-agent communicate_with_<name> tools and the older
+    # communicate_with_agent tool, which share this prefix
+    return tool_name.startswith('communicate_with_')
+
+
+def _on_tool_call_making(agent_id: str, data: dict):
+    click.echo(_thinking_line(agent_id))
+    if _is_agent_tool(data.get('tool', '')):
+        target = data.get('target', '')
+        msg = _preview(data.get('payload', {}).get('message', ''))
+        click.echo(f"{_styled_name(agent_id, 'cyan')} → {_styled_name(target, 'magenta')}: {msg}")
+
+
+def _on_tool_call_response(agent_id: str, data: dict):
+    if not _is_agent_tool(data.get('tool', '')):
+        return
+    
+    # This is a response from another agent
+    response = data.get('response', {})
+    target = data.get('target', '')
+    
+    # DEFENSIVE: Unwrap common response shapes (Fix B from GPT-5)
+    if not isinstance(response, dict) and hasattr(response, 'data'):
+        response = response.data
+    if not isinstance(response, dict):
+        response = {"agent": target, "response": str(response)}
+    
+    # Extract the responding agent from the response
+    from_agent = response.get('agent', target)
+    msg = _preview(response.get('response', ''))
+    # Use ← to show it's a response coming back
+    click.echo(f"{_styled_name(agent_id, 'cyan')} ← {_styled_name(from_agent, 'magenta')}: {msg}")
+
+
+# Event type -> printer for `chat --verbose`; other events are not shown
+CHAT_EVENT_HANDLERS = {
+    'tool_call_making': _on_tool_call_making,
+    'TOOL_CALL_MAKING': _on_tool_call_making,
+    'tool_call_response': _on_tool_call_response,
+    'TOOL_CALL_RESPONSE': _on_tool_call_response,
+}
+
+
 @cli.command()
 @click.argument('agent_name')
 @click.argument('message', required=False)
 @click.option('-i', '--interactive', is_flag=True, help='Interactive chat mode')
 @click.option('-v', '--verbose', is_flag=True, help='Show agent thinking and tool usage')
-def chat(agent_name: str, message: str, interactive: bool, verbose: bool):
+@click.pass_context
+def chat(ctx, agent_name: str, message: str, interactive: bool, verbose: bool):
     """Send a message to an agent via MCP protocol."""
     async def send_chat():
         # Get agent info from state
-        state = load_state()
+        state = ctx.obj['state']
         
         if agent_name not in state['agents']:
             click.echo(f"✗ Agent '{agent_name}' not found", err=True)
@@ -724,47 +1421,9 @@ async def send_chat():
             event_task = None
             if verbose:
                 async def handle_agent_event(event):
-                    event_type = event.get('type', '')
-                    agent_id = event.get('agent_id', '')
-                    data = event.get('data', {})
-                    
-                    # Debug events in verbose mode only
-                    if event_type:  # Only show meaningful events
-                        pass  # Raw debug removed - showing processed events below
-                    
-                    if event_type in ['tool_call_making', 'TOOL_CALL_MAKING']:
-                        click.echo(click.style(f"[{agent_id} thinking...]", fg='yellow'))
-                        tool_name = data.get('tool', '')
-                        # Support both old and new tool naming patterns
-                        if tool_name == 'communicate_with_agent' or tool_name.startswith('communicate_with_'):
-                            target = data.get('target', '')
-                            payload = data.get('payload', {})
-                            msg = payload.get('message', '')[:80] + '...' if len(payload.get('message', '')) > 80 else payload.get('message', '')
-                            styled_agent = click.style(agent_id, fg='cyan', bold=True)
-                            styled_target = click.style(target, fg='magenta', bold=True)
-                            click.echo(f"{styled_agent} → {styled_target}: {msg}")
-                    
-                    elif event_type in ['tool_call_response', 'TOOL_CALL_RESPONSE']:
-                        tool_name = data.get('tool', '')
-                        # Support both old and new tool naming patterns
-                        if tool_name == 'communicate_with_agent' or tool_name.startswith('communicate_with_'):
-                            # This is a response from another agent
-                            response = data.get('response', {})
-                            target = data.get('target', '')
-                            
-                            # DEFENSIVE: Unwrap common response shapes (Fix B from GPT-5)
-                            if not isinstance(response, dict) and hasattr(response, 'data'):
-                                response = response.data
-                            if not isinstance(response, dict):
-                                response = {"agent": target, "response": str(response)}
-                            
-                            # Extract the responding agent from the response
-                            from_agent = response.get('agent', target)
-                            msg = response.get('response', '')[:80] + '...' if len(response.get('response', '')) > 80 else response.get('response', '')
-                            styled_to = click.style(agent_id, fg='cyan', bold=True)
-                            styled_from = click.style(from_agent, fg='magenta', bold=True)
-                            # Use ← to show it's a response coming back
-                            click.echo(f"{styled_to} ← {styled_from}: {msg}")
+                    handler = CHAT_EVENT_HANDLERS.get(event.get('type', ''))
+                    if handler:
+                        handler(event.get('agent_id', ''), event.get('data', {}))
                 
                 # Subscribe to agent's event stream IMMEDIATELY
                 try:
@@ -788,10 +1447,12 @@ async def handle_agent_event(event):
             # Session for context management
             session_id = str(uuid.uuid4())
             
+            # Styled once for the whole session
+            styled_user = _styled_name("user", 'green')
+            styled_agent = _styled_name(agent_name, 'cyan')
+            
             async def send_message(msg):
                 if verbose:
-                    styled_user = click.style("user", fg='green', bold=True)
-                    styled_agent = click.style(agent_name, fg='cyan', bold=True)
                     click.echo(f"\n{styled_user} → {styled_agent}: {msg}")
                     
                 response = await client.call_tool(
@@ -803,12 +1464,9 @@ async def send_message(msg):
                 agent_response = response.data['response']
                 
                 if verbose:
-                    styled_agent = click.style(agent_name, fg='cyan', bold=True)
-                    styled_user = click.style("user", fg='green', bold=True)
                     # Use ← to show response coming TO user FROM agent
                     click.echo(f"{styled_user} ← {styled_agent}: {agent_response}\n")
                 else:
-                    styled_agent = click.style(agent_name, fg='cyan', bold=True)
                     click.echo(f"\n{styled_agent}: {agent_response}\n")
                     
                 return agent_response
@@ -840,11 +1498,9 @@ async def send_message(msg):
                         click.echo("\n\nExiting chat...")
                         break
             
-            # Give events time to be processed before cleanup
+            # Print any TOOL_CALL_RESPONSE events still in flight before cleanup
             if verbose and event_task and not event_task.done():
-                # Wait longer for any pending TOOL_CALL_RESPONSE events to be processed
-                # This fixes the race condition where events are emitted but CLI cleanup happens too fast
-                await asyncio.sleep(2.0)
+                await event_task.drain()
             
             # Cleanup
             await client.close_all()
@@ -860,14 +1516,11 @@ async def send_message(msg):
         except Exception as e:
             click.echo(f"✗ Failed to chat with agent: {e}", err=True)
     
-    asyncio.run(send_chat())
+    _run(send_chat())
 
 
-@cli.command()
-def init():
-    """Initialize a new agent configuration template."""
-    
-    template = """# Agent Configuration Template
+# Written by `agentctl init`; pre-encoded so it is always written with LF endings
+AGENT_TEMPLATE = b"""# Agent Configuration Template
 agent:
   name: my_agent
   llm_provider: google        # Options: openai, anthropic, google
@@ -883,11 +1536,14 @@ def init():
   level: INFO
   file: logs/my_agent.log
 """
-    
+
+
+@cli.command()
+def init():
+    """Initialize a new agent configuration template."""
     filename = "agent_template.yaml"
     
-    with open(filename, 'w') as f:
-        f.write(template)
+    Path(filename).write_bytes(AGENT_TEMPLATE)
     
     click.echo(f"✓ Created agent configuration template: {filename}")
     click.echo("\nEdit this file and then run:")
@@ -896,6 +1552,13 @@ def init():
 
 def main():
     """Entry point for CLI."""
+    # Use libuv's event loop for the socket-heavy commands when installed
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+    
     cli(obj={})
 
 
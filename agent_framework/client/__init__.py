@@ -1,3 +1,3 @@
-from .socket_client import AgentSocketClient
+from .socket_client import AgentSocketClient, EventSubscription
 
-__all__ = ['AgentSocketClient']
+__all__ = ['AgentSocketClient', 'EventSubscription']
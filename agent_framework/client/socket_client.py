@@ -1,19 +1,239 @@
 """Unified socket client for agent communication."""
 
 import asyncio
-import json
-import os
+import itertools
+import weakref
+from functools import lru_cache
 from typing import Dict, Any, Optional
 
+from ..core.serialization import dumps, loads
+
+
+# Sent untagged on event subscriptions, so encoded once
+_DRAIN_FRAME = dumps({"cmd": "drain"}) + b'\n'
+
+
+# Read-only commands that can be sent again if the first reply is lost
+_IDEMPOTENT_COMMANDS = frozenset({"health", "metrics"})
+
+# Commands that can take seconds (an MCP handshake); sent on a connection of
+# their own so agents that answer a connection's commands in order don't
+# hold quick probes behind them
+_BLOCKING_COMMANDS = frozenset({"connect"})
+
+
+class _NotSentError(ConnectionResetError):
+    """The connection failed before a request was written."""
+
+
+@lru_cache(maxsize=None)
+def _socket_path(agent_name: str) -> str:
+    """Control socket path for an agent, formatted once per name."""
+    return f"/tmp/chaotic-af/agent-{agent_name}.sock"
+
+
+class _PooledConnection:
+    """An open control-socket connection kept for reuse.
+    
+    Requests are pipelined: each one is written straight away, tagged with
+    an id, and whichever caller currently holds the read lock reads replies
+    and hands them to their waiting requests. Replies without an id (from
+    agents that don't echo one) go to the oldest unanswered request,
+    which matches the agent's in-order processing.
+    """
+    
+    def __init__(self, socket_path: str):
+        self.socket_path = socket_path
+        self.reader: Optional[asyncio.StreamReader] = None
+        self.writer: Optional[asyncio.StreamWriter] = None
+        self.pending: Dict[int, asyncio.Future] = {}
+        self._ids = itertools.count(1)
+        self._open_lock = asyncio.Lock()
+        self._read_lock = asyncio.Lock()
+    
+    async def open(self, timeout: float):
+        """Connect, unless another request already has."""
+        async with self._open_lock:
+            if self.writer is None:
+                self.reader, self.writer = await asyncio.wait_for(
+                    asyncio.open_unix_connection(self.socket_path),
+                    timeout=timeout
+                )
+    
+    async def request(self, command: Dict[str, Any], timeout: float) -> Dict[str, Any]:
+        """Send one command, tagged with a fresh id, and wait for its reply."""
+        request_id = next(self._ids)
+        future = asyncio.get_running_loop().create_future()
+        self.pending[request_id] = future
+        try:
+            try:
+                self.writer.write(dumps({**command, "id": request_id}) + b'\n')
+                await self.writer.drain()
+            except (ConnectionResetError, BrokenPipeError) as e:
+                # The agent can't have seen this command
+                raise _NotSentError(str(e)) from e
+            return await asyncio.wait_for(self._receive(future), timeout=timeout)
+        finally:
+            self.pending.pop(request_id, None)
+    
+    async def _receive(self, future: asyncio.Future) -> Dict[str, Any]:
+        while not future.done():
+            async with self._read_lock:
+                if future.done():
+                    break
+                try:
+                    line = await self.reader.readline()
+                    if not line:
+                        raise ConnectionResetError("connection closed by agent")
+                except (ConnectionResetError, BrokenPipeError) as e:
+                    # Every outstanding request on this connection is lost
+                    for waiter in self.pending.values():
+                        if not waiter.done():
+                            waiter.set_exception(e)
+                    break
+                
+                response = loads(line)
+                request_id = response.pop('id', None)
+                if request_id is None:
+                    waiter = next((w for w in self.pending.values() if not w.done()), None)
+                else:
+                    waiter = self.pending.get(request_id)
+                if waiter is not None and not waiter.done():
+                    waiter.set_result(response)
+        return future.result()
+    
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+
+
+class _EventStreamProtocol(asyncio.BufferedProtocol):
+    """Receives an event subscription straight into a preallocated buffer.
+    
+    The event loop reads into our buffer (no StreamReader copy). Complete
+    newline-delimited messages are parsed from it in place and queued for
+    the consuming task; None is queued when the connection ends.
+    """
+    
+    def __init__(self, buffer_size: int = 64 * 1024):
+        self._buf = bytearray(buffer_size)
+        self._view = memoryview(self._buf)
+        self._pos = 0
+        self.messages: asyncio.Queue = asyncio.Queue()
+        self.transport: Optional[asyncio.Transport] = None
+        self._ended = False
+    
+    def connection_made(self, transport):
+        self.transport = transport
+    
+    def get_buffer(self, sizehint: int) -> memoryview:
+        if self._pos == len(self._buf):
+            # A single message is larger than the buffer. The loop may still
+            # hold a view of the old buffer, so grow into a new one.
+            grown = bytearray(len(self._buf) * 2)
+            grown[:self._pos] = self._buf
+            self._buf = grown
+            self._view = memoryview(grown)
+        return self._view[self._pos:]
+    
+    def buffer_updated(self, nbytes: int):
+        # Only the new bytes can contain a newline not yet seen
+        end = self._buf.find(b'\n', self._pos, self._pos + nbytes)
+        self._pos += nbytes
+        start = 0
+        while end != -1:
+            self.messages.put_nowait(loads(self._view[start:end]))
+            start = end + 1
+            end = self._buf.find(b'\n', start, self._pos)
+        
+        if start:
+            # Keep the unfinished message at the front of the buffer
+            remaining = self._pos - start
+            self._view[:remaining] = self._buf[start:self._pos]
+            self._pos = remaining
+    
+    def _end(self):
+        if not self._ended:
+            self._ended = True
+            self.messages.put_nowait(None)
+    
+    def eof_received(self):
+        self._end()
+        return False  # Let the transport close itself
+    
+    def connection_lost(self, exc):
+        self._end()
+
+
+class EventSubscription:
+    """A running subscribe_events stream.
+    
+    Behaves like the task that reads the stream (done, cancel, await), and
+    can ask the agent to flush the events queued for it before teardown.
+    """
+    
+    def __init__(self, task: asyncio.Task, transport: asyncio.Transport,
+                 drained: asyncio.Event):
+        self.task = task
+        self._transport = transport
+        self._drained = drained
+    
+    def done(self) -> bool:
+        return self.task.done()
+    
+    def cancel(self) -> bool:
+        return self.task.cancel()
+    
+    def __await__(self):
+        return self.task.__await__()
+    
+    async def drain(self, timeout: float = 1.0) -> bool:
+        """Wait until the agent has sent and we have handled every queued event.
+        
+        Returns False if the stream ended or the timeout expired first.
+        """
+        if self.task.done():
+            return False
+        self._drained.clear()
+        self._transport.write(_DRAIN_FRAME)
+        waiter = asyncio.ensure_future(self._drained.wait())
+        try:
+            await asyncio.wait({waiter, self.task}, timeout=timeout,
+                               return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            waiter.cancel()
+        return self._drained.is_set()
+
 
 class AgentSocketClient:
     """Unified client for agent socket communication.
     
     This eliminates all duplicated socket communication code across the codebase.
+    Connections are pooled per event loop and socket path, so repeated
+    commands to the same agent (status, watch, health polling) share one
+    connection instead of reconnecting every time.
     """
     
-    @staticmethod
+    _pools: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, _PooledConnection]]" = weakref.WeakKeyDictionary()
+    
+    @classmethod
+    def _pool(cls) -> Dict[str, _PooledConnection]:
+        loop = asyncio.get_running_loop()
+        pool = cls._pools.get(loop)
+        if pool is None:
+            pool = cls._pools[loop] = {}
+        return pool
+    
+    @classmethod
+    def _discard(cls, socket_path: str, conn: _PooledConnection):
+        pool = cls._pool()
+        if pool.get(socket_path) is conn:
+            del pool[socket_path]
+        conn.close()
+    
+    @classmethod
     async def send_command(
+        cls,
         agent_name: str, 
         command: Dict[str, Any], 
         timeout: float = 5.0
@@ -21,38 +241,79 @@ async def send_command(
         """Send any command to an agent via socket.
         
         This is the single source of truth for socket communication.
+        Concurrent commands to the same agent are pipelined over one pooled
+        connection; connects, which can take seconds, get one of their own.
+        A pooled connection that turns out to be stale is reopened and the
+        command retried once, if it is read-only or was never written.
         """
-        socket_path = f"/tmp/chaotic-af/agent-{agent_name}.sock"
+        cmd = command.get("cmd")
+        # Read-only commands can be resent; the agent closes its socket
+        # after acknowledging a shutdown; connects get their own connection
+        idempotent = cmd in _IDEMPOTENT_COMMANDS
+        closes = cmd == "shutdown"
+        pooled = cmd not in _BLOCKING_COMMANDS
         
-        if not os.path.exists(socket_path):
-            return {"error": f"Socket not found for agent {agent_name}"}
+        socket_path = _socket_path(agent_name)
+        pool = cls._pool()
         
-        try:
-            reader, writer = await asyncio.wait_for(
-                asyncio.open_unix_connection(socket_path),
-                timeout=timeout
-            )
-            
-            # Send command
-            writer.write(json.dumps(command).encode() + b'\n')
-            await writer.drain()
-            
-            # Read response
-            response = await asyncio.wait_for(
-                reader.readline(),
-                timeout=timeout
-            )
+        for attempt in range(2):
+            conn = pool.get(socket_path) if pooled else _PooledConnection(socket_path)
+            if conn is None:
+                # Registered before connecting, so concurrent requests share it
+                conn = pool[socket_path] = _PooledConnection(socket_path)
+            reused = conn.writer is not None
             
-            # Close connection
-            writer.close()
-            await writer.wait_closed()
-            
-            return json.loads(response.decode())
+            try:
+                await conn.open(timeout)
+                response = await conn.request(command, timeout)
+                
+                if closes or not pooled:
+                    # The agent closes its socket after acknowledging, or
+                    # the connection was only for this request
+                    cls._discard(socket_path, conn)
+                
+                return response
+                
+            except (FileNotFoundError, ConnectionRefusedError):
+                # Nothing listening - connecting directly avoids a separate
+                # stat of the socket path, which would race anyway
+                cls._discard(socket_path, conn)
+                error = {"error": f"Socket not found for agent {agent_name}"}
+            except (ConnectionResetError, BrokenPipeError) as e:
+                cls._discard(socket_path, conn)
+                retryable = idempotent or isinstance(e, _NotSentError)
+                if reused and retryable and attempt == 0:
+                    continue
+                error = {"error": f"Failed to communicate with {agent_name}: {str(e)}"}
+            except asyncio.TimeoutError:
+                if conn.writer is None:
+                    cls._discard(socket_path, conn)
+                    error = {"error": f"Timeout connecting to {agent_name}"}
+                else:
+                    # Only this request gave up; others pipelined on the
+                    # connection keep waiting for their replies
+                    if not pooled:
+                        conn.close()
+                    error = {"error": f"Timeout waiting for {agent_name} to reply"}
+            except Exception as e:
+                cls._discard(socket_path, conn)
+                error = {"error": f"Failed to communicate with {agent_name}: {str(e)}"}
             
-        except asyncio.TimeoutError:
-            return {"error": f"Timeout connecting to {agent_name}"}
-        except Exception as e:
-            return {"error": f"Failed to communicate with {agent_name}: {str(e)}"}
+            return error
+    
+    @classmethod
+    async def close_all(cls):
+        """Close every pooled connection opened from the running event loop."""
+        pool = cls._pools.pop(asyncio.get_running_loop(), {})
+        for conn in pool.values():
+            conn.close()
+        for conn in pool.values():
+            if conn.writer is None:
+                continue
+            try:
+                await conn.writer.wait_closed()
+            except Exception:
+                pass
     
     @classmethod
     async def health_check(cls, agent_name: str, timeout: float = 5.0) -> Dict[str, Any]:
@@ -93,42 +354,44 @@ async def get_metrics(
         }, timeout)
     
     @staticmethod
-    async def subscribe_events(agent_name: str, event_handler: callable) -> asyncio.Task:
-        """Subscribe to agent events. Returns a task that streams events."""
-        socket_path = f"/tmp/chaotic-af/agent-{agent_name}.sock"
+    async def subscribe_events(agent_name: str, event_handler: callable) -> EventSubscription:
+        """Subscribe to agent events. Returns the subscription streaming them."""
+        socket_path = _socket_path(agent_name)
         
-        if not os.path.exists(socket_path):
-            raise FileNotFoundError(f"Socket not found for agent {agent_name}")
+        try:
+            transport, protocol = await asyncio.get_running_loop().create_unix_connection(
+                _EventStreamProtocol, socket_path
+            )
+        except (FileNotFoundError, ConnectionRefusedError):
+            raise FileNotFoundError(f"Socket not found for agent {agent_name}") from None
+        
+        drained = asyncio.Event()
         
         async def event_stream():
-            reader, writer = await asyncio.open_unix_connection(socket_path)
-            
             try:
                 # Send subscribe command
                 cmd = {"cmd": "subscribe_events"}
-                writer.write(json.dumps(cmd).encode() + b'\n')
-                await writer.drain()
+                transport.write(dumps(cmd) + b'\n')
                 
                 # Read initial response
-                response = await reader.readline()
-                result = json.loads(response.decode())
+                result = await protocol.messages.get()
                 
-                if result.get('status') != 'subscribed':
+                if result is None or result.get('status') != 'subscribed':
                     raise Exception(f"Failed to subscribe: {result}")
                 
                 # Stream events
                 while True:
-                    line = await reader.readline()
-                    if not line:
+                    data = await protocol.messages.get()
+                    if data is None:
                         break
                     
-                    data = json.loads(line.decode())
                     if 'event' in data:
                         await event_handler(data['event'])
+                    elif data.get('status') == 'drained':
+                        drained.set()
                         
             finally:
-                writer.close()
-                await writer.wait_closed()
+                transport.close()
         
-        # Return the task so caller can manage it
-        return asyncio.create_task(event_stream())
+        # Return the subscription so caller can manage it
+        return EventSubscription(asyncio.create_task(event_stream()), transport, drained)
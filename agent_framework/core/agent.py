@@ -9,7 +9,7 @@
 """
 
 import asyncio
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 import uuid
 
 from ..core.config import AgentConfig, get_llm_key
@@ -19,6 +19,7 @@
 from ..mcp.server_universal import UniversalAgentMCPServer
 from ..mcp.client import AgentMCPClient
 from ..core.metrics import MetricsCollector, AgentMetrics
+from ..core import serialization
 
 
 class Agent:
@@ -80,6 +81,10 @@ def __init__(self, config: AgentConfig, available_agents: List[str]):
         # Track if agent is running
         self.is_running = False
         self._server_task: Optional[asyncio.Task] = None
+        
+        # LLM tool name -> ("agent", target) or ("external", server, tool),
+        # parsed once per name
+        self._tool_routes: Dict[str, Optional[Tuple[str, ...]]] = {}
     
     async def start(self):
         """Start the agent - but don't connect to others yet."""
@@ -106,20 +111,23 @@ async def connect_to_peers(self):
         """Connect to external MCP servers only. Agent connections are now dynamic."""
         self.logger.info(f"Agent {self.agent_id} ready for dynamic connections")
         
-        # Only connect to external MCP servers configured in YAML
-        for server in self.config.external_mcp_servers:
-            try:
-                await self.mcp_client.add_connection(
-                    server["name"],
-                    server["url"]
-                )
-                self.logger.info(f"Connected to external server: {server['name']}")
-            except Exception as e:
+        # Only connect to external MCP servers configured in YAML. They are
+        # independent, so connect to all of them concurrently.
+        servers = self.config.external_mcp_servers
+        results = await asyncio.gather(*[
+            self.mcp_client.add_connection(server["name"], server["url"])
+            for server in servers
+        ], return_exceptions=True)
+        
+        for server, result in zip(servers, results):
+            if isinstance(result, BaseException):
                 self.logger.error(
-                    f"Failed to connect to external server {server['name']}: {str(e)}",
+                    f"Failed to connect to external server {server['name']}: {str(result)}",
                     event_type="connection",
                     correlation_id=None
                 )
+            else:
+                self.logger.info(f"Connected to external server: {server['name']}")
         
         # Update server's available connections
         if hasattr(self.mcp_server, 'update_connections'):
@@ -133,53 +141,58 @@ async def handle_tool_calls(self, tool_calls: List[ToolCall]) -> List[Dict[str,
         
         This is where LLM tool calls get translated into actual MCP calls.
         """
-        results = []
+        # Independent calls - run them concurrently, keeping their order
+        results = await asyncio.gather(*[
+            self._execute_tool_call(tool_call) for tool_call in tool_calls
+        ], return_exceptions=True)
         
-        for tool_call in tool_calls:
-            correlation_id = str(uuid.uuid4())
-            
-            # Check if this is an agent communication tool
-            if tool_call.tool.startswith("communicate_with_"):
-                # Extract agent name (communicate_with_alice -> alice)
-                target_agent = tool_call.tool.replace("communicate_with_", "")
-                message = tool_call.parameters.get("message", "")
-                
-                # Use MCP client to communicate
-                result = await self.mcp_client.communicate_with_agent(
-                    target_agent=target_agent,
-                    message=message
-                )
-                
-                results.append({
-                    "tool_call_id": tool_call.id,
-                    "result": result
-                })
-            
-            else:
-                # This is an external tool call
-                # Parse server.tool format
-                if "." in tool_call.tool:
-                    server_name, tool_name = tool_call.tool.split(".", 1)
-                    
-                    result = await self.mcp_client.call_tool(
-                        server_name=server_name,
-                        tool_name=tool_name,
-                        arguments=tool_call.parameters
-                    )
-                    
-                    results.append({
-                        "tool_call_id": tool_call.id,
-                        "result": result
-                    })
-                else:
-                    # Unknown tool format
-                    self.logger.warning(f"Unknown tool format: {tool_call.tool}")
-                    results.append({
-                        "tool_call_id": tool_call.id,
-                        "result": {"error": f"Unknown tool: {tool_call.tool}"}
-                    })
+        return [
+            {"tool_call_id": tool_call.id, "result": {"error": str(result)}}
+            if isinstance(result, BaseException) else
+            {"tool_call_id": tool_call.id, "result": result}
+            for tool_call, result in zip(tool_calls, results)
+        ]
+    
+    async def _execute_tool_call(self, tool_call: ToolCall) -> Any:
+        """Run a single LLM tool call and return its result."""
+        route = self._route_tool(tool_call.tool)
+        
+        if route is None:
+            # Unknown tool format
+            self.logger.warning(f"Unknown tool format: {tool_call.tool}")
+            return {"error": f"Unknown tool: {tool_call.tool}"}
+        
+        if route[0] == "agent":
+            # Agent communication tool - use MCP client to communicate
+            return await self.mcp_client.communicate_with_agent(
+                target_agent=route[1],
+                message=tool_call.parameters.get("message", "")
+            )
+        
+        # External tool call in server.tool format
+        return await self.mcp_client.call_tool(
+            server_name=route[1],
+            tool_name=route[2],
+            arguments=tool_call.parameters
+        )
+    
+    def _route_tool(self, tool: str) -> Optional[Tuple[str, ...]]:
+        """Work out where an LLM tool call goes, caching the parse per tool name."""
+        try:
+            return self._tool_routes[tool]
+        except KeyError:
+            pass
         
-        return results
+        if tool.startswith("communicate_with_"):
+            # communicate_with_alice -> alice
+            route = ("agent", tool[len("communicate_with_"):])
+        elif "." in tool:
+            route = ("external", *tool.split(".", 1))
+        else:
+            route = None
+        
+        self._tool_routes[tool] = route
+        return route
     
     async def think_and_act(
         self,
@@ -199,14 +212,14 @@ async def think_and_act(
         messages.append({"role": "user", "content": prompt})
         
         # Add system message if not present
-        if not any(m["role"] == "system" for m in messages):
+        if messages[0]["role"] != "system":
             messages.insert(0, {
                 "role": "system",
-                "content": self.mcp_server._build_agent_system_prompt()
+                "content": self.mcp_server.get_system_prompt()
             })
         
         # Get LLM response with tools
-        tools = await self.mcp_client.get_available_agent_tools()
+        tools = await self.mcp_server.get_agent_tools()
         response = await self.llm.complete(messages, tools)
         
         # Log reasoning
@@ -224,9 +237,16 @@ async def think_and_act(
             messages.append({"role": "assistant", "content": response.content})
             
             for result in tool_results:
+                try:
+                    content = serialization.dumps(
+                        result["result"], default=str, non_str_keys=True
+                    ).decode()
+                except (TypeError, ValueError):
+                    # Not JSON even with stringified keys (e.g. tuple keys)
+                    content = str(result["result"])
                 messages.append({
                     "role": "tool",
-                    "content": f"Tool result: {result['result']}"
+                    "content": "Tool result: " + content
                 })
             
             # Get final response after tool use
@@ -261,6 +281,7 @@ async def stop(self):
                 EventType.AGENT_STOPPED,
                 {"agent_id": self.agent_id}
             )
+            await self.event_stream.close()
             
             self.logger.info(f"Agent {self.agent_id} stopped")
             
@@ -8,19 +8,39 @@
 """
 
 import os
-from dataclasses import dataclass, field
+import pickle
+import hashlib
+from dataclasses import asdict, dataclass, field, fields
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Optional, Dict, Any
 import yaml
 from dotenv import load_dotenv
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
 # Load environment variables
 load_dotenv()
 
+# Parsed configs are cached here so repeat CLI runs can skip YAML parsing
+CONFIG_CACHE_DIR = Path.home() / ".chaotic-af" / "cfgcache"
+
+# Bump when the cache entry format changes; AgentConfig's fields are also
+# part of every cache key, so entries from other versions are never read
+CONFIG_CACHE_VERSION = 2
 
-@dataclass
+
+@dataclass(frozen=True)
 class AgentConfig:
-    """Configuration for a single agent node."""
+    """Configuration for a single agent node.
+    
+    Frozen so one instance can be shared safely between tasks; use
+    dataclasses.replace() to derive a modified copy.
+    """
     name: str
     llm_provider: str  # "openai", "anthropic", "google"
     llm_model: str
@@ -68,9 +88,71 @@ def get_llm_key(provider: str) -> str:
     return api_key
 
 
-def load_config(config_path: str) -> AgentConfig:
+@lru_cache(maxsize=None)
+def _config_schema() -> str:
+    """Cache format version plus AgentConfig's field names and types."""
+    field_specs = ",".join(f"{f.name}:{f.type}" for f in fields(AgentConfig))
+    return f"{CONFIG_CACHE_VERSION}:{field_specs}"
+
+
+def _config_cache_path(path: Path, mtime_ns: int, size: int) -> Path:
+    """Get the cache file for a config at a given modification time and size.
+    
+    Entries are named `<path digest>-<version digest>.pkl` so that stale
+    entries for the same file can be found and pruned. The version digest
+    also covers the cache schema, so an upgrade that changes AgentConfig
+    never reads entries written by the old code.
+    """
+    path_key = hashlib.blake2b(str(path).encode(), digest_size=16).hexdigest()
+    mtime_key = hashlib.blake2b(
+        f"{path}:{mtime_ns}:{size}:{_config_schema()}".encode(), digest_size=16
+    ).hexdigest()
+    return CONFIG_CACHE_DIR / f"{path_key}-{mtime_key}.pkl"
+
+
+def _read_cached_config(cache_path: Path) -> Optional[AgentConfig]:
+    """Load a cached config, returning None on any miss or corruption.
+    
+    Entries hold the config's field values, and the AgentConfig is built
+    from them, so __post_init__ validation runs on every load.
+    """
+    try:
+        with open(cache_path, 'rb') as f:
+            values = pickle.load(f)
+        return AgentConfig(**values)
+    except Exception:
+        return None
+
+
+def _write_cached_config(cache_path: Path, config: AgentConfig) -> None:
+    """Atomically store a parsed config and prune stale entries for the file.
+    
+    Caching is best-effort: any filesystem error is ignored.
+    """
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(asdict(config), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+        
+        # Drop entries for older versions of the same file
+        path_key = cache_path.name.split("-", 1)[0]
+        for stale in cache_path.parent.glob(f"{path_key}-*.pkl"):
+            if stale != cache_path:
+                stale.unlink(missing_ok=True)
+    except OSError:
+        pass
+
+
+def load_config(config_path: str, use_cache: bool = True) -> AgentConfig:
     """Load agent configuration from YAML file.
     
+    Parsed configs are cached keyed by the file's absolute path,
+    modification time and size: in memory for the life of the process, and in
+    ~/.chaotic-af/cfgcache across processes. Editing the file invalidates
+    both. Pass use_cache=False to always parse the YAML.
+    
     Example YAML:
     ```yaml
     agent:
@@ -92,11 +174,32 @@ def load_config(config_path: str) -> AgentConfig:
     ```
     """
     path = Path(config_path)
-    if not path.exists():
-        raise FileNotFoundError(f"Configuration file not found: {config_path}")
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Configuration file not found: {config_path}") from None
+    
+    if not use_cache:
+        return _parse_config(path)
     
+    return _load_config_cached(str(path.absolute()), st.st_mtime_ns, st.st_size)
+
+
+@lru_cache(maxsize=128)
+def _load_config_cached(abs_path: str, mtime_ns: int, size: int) -> AgentConfig:
+    """Load a config through the on-disk cache, memoized per process."""
+    cache_path = _config_cache_path(Path(abs_path), mtime_ns, size)
+    config = _read_cached_config(cache_path)
+    if config is None:
+        config = _parse_config(Path(abs_path))
+        _write_cached_config(cache_path, config)
+    return config
+
+
+def _parse_config(path: Path) -> AgentConfig:
+    """Parse a YAML config file into an AgentConfig."""
     with open(path) as f:
-        data = yaml.safe_load(f)
+        data = yaml.load(f, Loader=SafeLoader)
     
     # Extract agent configuration
     agent_data = data.get("agent", {})
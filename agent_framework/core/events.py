@@ -7,14 +7,17 @@
 - Minimal overhead
 """
 
-import json
+import time
 from datetime import datetime, timezone
-from typing import Dict, Any, List, Optional, Callable
-from dataclasses import dataclass, asdict
+from typing import Dict, Any, List, Optional, Callable, Tuple
+from dataclasses import dataclass, field
 from collections import deque
+from itertools import islice
 import asyncio
 from enum import Enum
 
+from .serialization import dumps
+
 
 class EventType(str, Enum):
     """Types of events emitted by agents."""
@@ -46,31 +49,87 @@ class EventType(str, Enum):
 @dataclass
 class AgentEvent:
     """Structured event emitted by an agent."""
-    timestamp: datetime
+    timestamp: float  # Unix time; formatted only when serialized
     agent_id: str
     event_type: EventType
     data: Dict[str, Any]
     correlation_id: Optional[str] = None  # For tracking related events
+    _stream_frame: Optional[bytes] = field(default=None, init=False, repr=False, compare=False)
+    
+    @property
+    def dt(self) -> datetime:
+        """The timestamp as an aware UTC datetime."""
+        return datetime.fromtimestamp(self.timestamp, timezone.utc)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert event to a plain dict (data is shared, not copied)."""
+        return {
+            'timestamp': self.dt.isoformat(),
+            'agent_id': self.agent_id,
+            'event_type': self.event_type.value,
+            'data': self.data,
+            'correlation_id': self.correlation_id
+        }
     
     def to_json(self) -> str:
         """Convert event to JSON for streaming."""
-        event_dict = asdict(self)
-        event_dict['timestamp'] = self.timestamp.isoformat()
-        event_dict['event_type'] = self.event_type.value
-        return json.dumps(event_dict)
+        return dumps(self.to_dict()).decode()
+    
+    def stream_frame(self) -> bytes:
+        """Frame sent to subscribe_events clients, encoded once per event."""
+        if self._stream_frame is None:
+            self._stream_frame = dumps({
+                'event': {
+                    'type': self.event_type,
+                    'agent_id': self.agent_id,
+                    'data': self.data,
+                    'timestamp': self.dt.isoformat()
+                }
+            }) + b'\n'
+        return self._stream_frame
+
+
+class _SubscriberSlot:
+    """Bounded delivery queue and task for one subscriber."""
+    
+    def __init__(self, callback: Callable[[AgentEvent], None], maxsize: int):
+        self.callback = callback
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize)
+        self.task: Optional[asyncio.Task] = None
+        self.dropped = 0
+        self.lagging = False  # Above the high-water mark, already warned
 
 
 class EventStream:
     """Manages event emission and subscription for an agent.
     
     This enables future UI connections to observe agent behavior in real-time.
+    Each subscriber gets its own bounded queue drained by one long-lived
+    task, so a slow subscriber neither delays the others nor grows memory
+    without bound. When its queue is full, overflow decides what happens:
+    "drop_newest" discards the new event, "drop_oldest" discards the oldest
+    queued one, and "block" makes emit wait for room.
     """
     
-    def __init__(self, agent_id: str, history_size: int = 1000):
+    OVERFLOW_POLICIES = ("drop_newest", "drop_oldest", "block")
+    
+    def __init__(self, agent_id: str, history_size: int = 1000,
+                 subscriber_queue_size: int = 256, overflow: str = "drop_newest"):
+        if overflow not in self.OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown overflow policy: {overflow}")
+        
         self.agent_id = agent_id
         self.history = deque(maxlen=history_size)
-        self.subscribers: List[Callable[[AgentEvent], None]] = []
-        self._lock = asyncio.Lock()
+        # Replaced, never mutated, on (un)subscribe - so iterating it
+        # needs no lock or copy
+        self.subscribers: Tuple[Callable[[AgentEvent], None], ...] = ()
+        
+        self.subscriber_queue_size = subscriber_queue_size
+        self.overflow = overflow
+        self.dropped_events = 0
+        # Warn once a subscriber's queue is this full
+        self._high_water = max(1, subscriber_queue_size * 4 // 5)
+        self._slots: Dict[Callable, _SubscriberSlot] = {}
     
     async def emit(self, event_type: EventType, data: Dict[str, Any], 
                    correlation_id: Optional[str] = None) -> None:
@@ -79,41 +138,80 @@ async def emit(self, event_type: EventType, data: Dict[str, Any],
         This is the core method called throughout the agent to report activity.
         """
         event = AgentEvent(
-            timestamp=datetime.now(timezone.utc),
+            timestamp=time.time(),
             agent_id=self.agent_id,
             event_type=event_type,
             data=data,
             correlation_id=correlation_id
         )
         
-        # Event emission to all subscribers
+        # Store in history
+        self.history.append(event)
         
-        async with self._lock:
-            # Store in history
-            self.history.append(event)
-            
-            # Notify all subscribers
-            # Collect all notification tasks
-            tasks = []
-            for subscriber in self.subscribers:
-                try:
-                    # Create task for each subscriber
-                    task = asyncio.create_task(self._notify_subscriber(subscriber, event))
-                    tasks.append(task)
-                except Exception as e:
-                    # Log error but don't crash on subscriber failure
-                    print(f"Error notifying subscriber: {e}")
-            
-            # Wait for all notifications to complete (with a timeout)
-            if tasks:
-                try:
-                    await asyncio.wait_for(
-                        asyncio.gather(*tasks, return_exceptions=True),
-                        timeout=1.0  # 1 second timeout for event delivery
-                    )
-                except asyncio.TimeoutError:
-                    # Log but don't fail if notifications are slow
-                    print(f"Warning: Event notifications timed out for {event_type}")
+        # Queue for each subscriber; emitters only wait under "block"
+        for subscriber in self.subscribers:
+            slot = self._slots.get(subscriber)
+            if slot is None or slot.task.done():
+                slot = self._slots[subscriber] = self._start_slot(subscriber)
+            await self._offer(slot, event)
+    
+    def _start_slot(self, subscriber: Callable) -> _SubscriberSlot:
+        slot = _SubscriberSlot(subscriber, self.subscriber_queue_size)
+        slot.task = asyncio.create_task(self._deliver(slot))
+        return slot
+    
+    async def _offer(self, slot: _SubscriberSlot, event: AgentEvent) -> None:
+        queue = slot.queue
+        if queue.full():
+            if self.overflow == "block":
+                await queue.put(event)
+                return
+            if self.overflow == "drop_oldest":
+                queue.get_nowait()
+                queue.task_done()
+                queue.put_nowait(event)
+            slot.dropped += 1
+            self.dropped_events += 1
+            return
+        
+        queue.put_nowait(event)
+        if queue.qsize() >= self._high_water:
+            if not slot.lagging:
+                slot.lagging = True
+                print(f"Warning: slow event subscriber on {self.agent_id} "
+                      f"({queue.qsize()}/{queue.maxsize} events queued)")
+        else:
+            slot.lagging = False
+    
+    async def _deliver(self, slot: _SubscriberSlot) -> None:
+        """Deliver a subscriber's queued events to it, in order."""
+        while True:
+            event = await slot.queue.get()
+            try:
+                await self._notify_subscriber(slot.callback, event)
+            except Exception as e:
+                # Log error but don't crash on subscriber failure
+                print(f"Error notifying subscriber: {e}")
+            finally:
+                slot.queue.task_done()
+    
+    async def close(self, timeout: float = 1.0) -> None:
+        """Deliver any queued events, then stop the delivery tasks."""
+        slots = list(self._slots.values())
+        self._slots = {}
+        if not slots:
+            return
+        try:
+            await asyncio.wait_for(
+                asyncio.gather(*[slot.queue.join() for slot in slots]),
+                timeout=timeout
+            )
+        except asyncio.TimeoutError:
+            # Log but don't fail if notifications are slow
+            print(f"Warning: Event notifications timed out for {self.agent_id}")
+        for slot in slots:
+            slot.task.cancel()
+        await asyncio.gather(*[slot.task for slot in slots], return_exceptions=True)
     
     async def _notify_subscriber(self, subscriber: Callable, event: AgentEvent) -> None:
         """Notify a single subscriber, handling async/sync callbacks."""
@@ -124,18 +222,42 @@ async def _notify_subscriber(self, subscriber: Callable, event: AgentEvent) -> N
     
     def subscribe(self, callback: Callable[[AgentEvent], None]) -> Callable[[], None]:
         """Subscribe to events. Returns unsubscribe function."""
-        self.subscribers.append(callback)
+        self.subscribers = self.subscribers + (callback,)
         
         def unsubscribe():
-            if callback in self.subscribers:
-                self.subscribers.remove(callback)
+            self.unsubscribe(callback)
         
         return unsubscribe
     
+    def unsubscribe(self, callback: Callable[[AgentEvent], None]) -> None:
+        """Stop delivering events to a callback."""
+        # Compare by equality, as the slot lookup does: bound methods are
+        # new objects on each access but compare equal
+        self.subscribers = tuple(s for s in self.subscribers if s != callback)
+        slot = self._slots.pop(callback, None)
+        if slot is not None:
+            slot.task.cancel()
+    
+    async def flush(self, callback: Callable[[AgentEvent], None]) -> None:
+        """Wait until every event queued for a subscriber has been delivered."""
+        slot = self._slots.get(callback)
+        if slot is not None:
+            await slot.queue.join()
+    
     def get_history(self, limit: Optional[int] = None) -> List[AgentEvent]:
-        """Get recent event history."""
+        """Get recent event history, oldest first.
+        
+        With a limit only the newest ``limit`` events are copied; without
+        one (or with 0) the whole history is, so prefer subscribing for
+        live updates. A negative limit raises ValueError.
+        """
+        if limit is not None and limit < 0:
+            raise ValueError(f"History limit must not be negative, got {limit}")
         if limit:
-            return list(self.history)[-limit:]
+            # Walk back from the newest end so only `limit` events are touched
+            recent = list(islice(reversed(self.history), limit))
+            recent.reverse()
+            return recent
         return list(self.history)
     
     def clear_history(self) -> None:
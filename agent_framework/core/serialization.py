@@ -0,0 +1,45 @@
+"""Fast JSON encoding for state files and socket frames.
+
+Requirements:
+- Use orjson when installed, stdlib json otherwise
+- Always encode to bytes so callers can write straight to files/sockets
+- Accept bytes, buffers (memoryview) or str when decoding
+"""
+
+import json
+from typing import Any, Callable, Optional, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps(obj: Any, default: Optional[Callable[[Any], Any]] = None,
+          non_str_keys: bool = False) -> bytes:
+    """Serialize an object to compact JSON bytes.
+    
+    ``default`` converts values JSON can't represent, as in ``json.dumps``.
+    ``non_str_keys`` allows int, float, bool and None dict keys, which are
+    written as strings the way stdlib json always does.
+    """
+    if orjson:
+        option = orjson.OPT_NON_STR_KEYS if non_str_keys else None
+        return orjson.dumps(obj, default=default, option=option)
+    return json.dumps(obj, default=default).encode()
+
+
+def dumps_pretty(obj: Any) -> bytes:
+    """Serialize an object to JSON bytes indented by two spaces."""
+    if orjson:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode()
+
+
+def loads(data: Union[bytes, bytearray, memoryview, str]) -> Any:
+    """Deserialize JSON from bytes, a buffer, or str."""
+    if orjson:
+        return orjson.loads(data)
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return json.loads(data)
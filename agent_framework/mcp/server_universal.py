@@ -41,6 +41,11 @@ def __init__(
         # Track available connections dynamically
         self.available_connections: List[str] = []
         
+        # LLM inputs derived from connections, rebuilt after update_connections
+        self._cache_gen = 0
+        self._cached_system_prompt: Optional[str] = None
+        self._cached_tools: Optional[List[ToolDefinition]] = None
+        
         # Create FastMCP server
         self.server = FastMCP()
         
@@ -66,8 +71,31 @@ def _build_agent_system_prompt(self) -> str:
     def update_connections(self, connections: List[str]):
         """Update the list of available connections."""
         self.available_connections = connections
+        self._cache_gen += 1
+        self._cached_system_prompt = None
+        self._cached_tools = None
         self.logger.info(f"Updated connections: {connections}")
     
+    def get_system_prompt(self) -> str:
+        """Get the system prompt, rebuilt only when connections change."""
+        if self._cached_system_prompt is None:
+            self._cached_system_prompt = self._build_agent_system_prompt()
+        return self._cached_system_prompt
+    
+    async def get_agent_tools(self) -> List[ToolDefinition]:
+        """Get the LLM tools for connected agents, fetched only when connections change."""
+        if self._cached_tools is not None:
+            return self._cached_tools
+        if not self.mcp_client:
+            return []
+        
+        gen = self._cache_gen
+        tools = await self.mcp_client.get_available_agent_tools()
+        # Don't cache a list fetched across an update_connections call
+        if gen == self._cache_gen:
+            self._cached_tools = tools
+        return tools
+    
     def _register_tools(self):
         """Register universal agent communication tools."""
         
@@ -114,7 +142,7 @@ async def communicate_with_agent(
             
             try:
                 # Build system prompt
-                system_prompt = self._build_agent_system_prompt()
+                system_prompt = self.get_system_prompt()
                 
                 # Build specific prompt for agent-to-agent communication
                 if self.chaos_mode:
@@ -173,7 +201,7 @@ async def communicate_with_agent(
                 # Chaos mode: Give agents tool access for chain reactions if enabled
                 available_tools = []
                 if self.chaos_mode and self.mcp_client:
-                    available_tools = await self.mcp_client.get_available_agent_tools()
+                    available_tools = await self.get_agent_tools()
                     self.logger.info(f"CHAOS MODE ENABLED: Agent has access to {len(available_tools)} agent tools")
                 else:
                     self.logger.info("GUARDRAIL MODE: Agent has no tool access (prevents infinite loops)")
@@ -268,7 +296,7 @@ async def chat_with_user(
                 # Get available tools from connected agents
                 available_tools = []
                 if self.mcp_client:
-                    available_tools = await self.mcp_client.get_available_agent_tools()
+                    available_tools = await self.get_agent_tools()
                 
                 # Build user-specific system prompt
                 connected_agents = ', '.join(self.available_connections) if self.available_connections else 'None'
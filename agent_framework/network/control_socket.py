@@ -1,9 +1,10 @@
 """Simple control socket for agent commands."""
 
 import asyncio
-import json
 import os
+import socket
 from ..core.logging import AgentLogger
+from ..core.serialization import dumps, loads
 
 
 class AgentControlSocket:
@@ -13,7 +14,6 @@ def __init__(self, agent, socket_path: str, shutdown_event=None):
         self.agent = agent
         self.socket_path = socket_path
         self.shutdown_event = shutdown_event
-        self._event_subscription = None
         # Use the agent's logger if available, otherwise create a basic one
         self.logger = agent.logger if hasattr(agent, 'logger') else AgentLogger(
             agent_id=agent.agent_id if hasattr(agent, 'agent_id') else 'control_socket',
@@ -29,144 +29,190 @@ async def start(self):
         if os.path.exists(self.socket_path):
             os.unlink(self.socket_path)
         
-        # Create server
+        # Create server. One listener is enough: Linux doesn't spread
+        # AF_UNIX connections across SO_REUSEPORT sockets, and extra accept
+        # tasks would share this event loop anyway. A deeper backlog lets a
+        # burst of CLIs/monitors queue instead of being refused.
         server = await asyncio.start_unix_server(
             self._handle_connection,
-            self.socket_path
+            self.socket_path,
+            backlog=socket.SOMAXCONN
         )
         
         return server
     
     async def _handle_connection(self, reader, writer):
-        """Handle a single control connection."""
-        try:
-            # Read command
-            data = await reader.readline()
-            if not data:
-                return
-                
-            cmd = json.loads(data.decode())
-            
-            # Process command
-            if cmd['cmd'] == 'health':
-                response = {'status': 'ready'}
-            
-            elif cmd['cmd'] == 'connect':
-                # Add connection to agent
-                success = await self.agent.mcp_client.add_connection(
-                    cmd['target'],
-                    cmd['endpoint']
-                )
-                
-                # Update server if needed
-                if hasattr(self.agent.mcp_server, 'update_connections'):
-                    connections = list(self.agent.mcp_client.connections.keys())
-                    self.agent.mcp_server.update_connections(connections)
-                
-                response = {'status': 'connected' if success else 'failed'}
-            
-            elif cmd['cmd'] == 'shutdown':
-                # Trigger shutdown
-                if hasattr(self.agent, '_shutdown_event'):
-                    self.agent._shutdown_event.set()
-                if self.shutdown_event:
-                    self.shutdown_event.set()
-                response = {'status': 'shutting_down'}
-                
-                # Schedule socket cleanup after response
-                asyncio.create_task(self._cleanup_socket())
-            
-            elif cmd['cmd'] == 'metrics':
-                # Return metrics in requested format
-                format_type = cmd.get('format', 'json')
-                
-                if hasattr(self.agent, 'metrics_collector'):
-                    if format_type == 'prometheus':
-                        metrics_text = self.agent.metrics_collector.get_metrics_prometheus()
-                        response = {'metrics': metrics_text}
-                    else:
-                        metrics_json = self.agent.metrics_collector.get_metrics_json()
-                        response = {'metrics': metrics_json}
-                else:
-                    response = {'error': 'Metrics not available'}
-            
-            elif cmd['cmd'] == 'subscribe_events':
-                # Subscribe to agent events and stream them
-                response = {'status': 'subscribed'}
-                
-                # Send initial response
-                writer.write(json.dumps(response).encode() + b'\n')
+        """Handle a control connection.
+        
+        A connection may carry any number of newline-delimited commands, so
+        clients can keep it open and pipeline requests. Commands tagged with
+        an "id" run concurrently and each reply echoes its id as soon as it
+        is ready, so a slow connect doesn't hold up a health check behind
+        it; untagged commands are answered in order. A subscribe_events
+        command turns the connection into an event stream for the rest of
+        its life; on it, a drain command is answered with a "drained"
+        status once every event queued for the connection has been written.
+        """
+        tasks = set()
+        write_lock = asyncio.Lock()
+        
+        async def reply(response, request_id):
+            # Echo the request id so pipelining clients can match replies
+            if request_id is not None:
+                response['id'] = request_id
+            async with write_lock:
+                writer.write(dumps(response) + b'\n')
                 await writer.drain()
+        
+        async def run_command(cmd, request_id):
+            try:
+                response = await self._process_command(cmd)
+            except Exception as e:
+                response = {'error': str(e)}
+            try:
+                await reply(response, request_id)
+            except (ConnectionResetError, BrokenPipeError):
+                pass  # Client went away before the reply
+        
+        try:
+            while True:
+                # Read command
+                data = await reader.readline()
+                if not data:
+                    return
                 
-                # Set up event forwarding
-                if hasattr(self.agent, 'event_stream'):
-                    async def forward_event(event):
-                        # Forward event to client
-                        try:
-                            event_data = {
-                                'event': {
-                                    'type': event.event_type,
-                                    'agent_id': event.agent_id,
-                                    'data': event.data,
-                                    'timestamp': event.timestamp.isoformat()
-                                }
-                            }
-                            writer.write(json.dumps(event_data).encode() + b'\n')
-                            await writer.drain()
-                        except Exception as e:
-                            # Connection closed, unsubscribe
-                            self.logger.debug(f"Event forwarding error: {e}")
-                            if hasattr(self.agent, 'event_stream'):
-                                self.agent.event_stream.unsubscribe(forward_event)
+                request_id = None
+                try:
+                    cmd = loads(data)
+                    request_id = cmd.get('id')
                     
-                    # Subscribe to agent's event stream
-                    unsubscribe_func = self.agent.event_stream.subscribe(forward_event)
-                    self._event_subscription = unsubscribe_func
-                    self.logger.info(f"Subscribed to event stream for {self.agent.agent_id}, subscribers: {len(self.agent.event_stream.subscribers)}")
+                    if cmd['cmd'] == 'subscribe_events':
+                        await self._stream_events(reader, writer)
+                        return  # Skip normal response/cleanup
                     
-                    # Keep connection open for streaming events
-                    try:
-                        # Wait indefinitely while connection is open
-                        while True:
-                            # Check if connection is still alive
-                            await asyncio.sleep(1)
-                            # The events are sent via forward_event callback
-                    except (ConnectionResetError, BrokenPipeError):
-                        # Client disconnected
-                        pass
-                    finally:
-                        # Unsubscribe when connection closes
-                        if hasattr(self.agent, 'event_stream'):
-                            self.agent.event_stream.unsubscribe(forward_event)
+                    if request_id is not None:
+                        task = asyncio.create_task(run_command(cmd, request_id))
+                        tasks.add(task)
+                        task.add_done_callback(tasks.discard)
+                        continue
                     
-                    return  # Skip normal response/cleanup
-                else:
-                    response = {'error': 'Event stream not available'}
+                    response = await self._process_command(cmd)
+                except Exception as e:
+                    # Send error
+                    response = {'error': str(e)}
+                
+                await reply(response, request_id)
+        
+        except (ConnectionResetError, BrokenPipeError):
+            # Client went away mid-request
+            pass
+        
+        finally:
+            # Let commands already started finish before closing
+            if tasks:
+                await asyncio.gather(*tasks, return_exceptions=True)
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except (ConnectionResetError, BrokenPipeError):
+                pass
+    
+    async def _process_command(self, cmd: dict) -> dict:
+        """Execute a single request/response command."""
+        if cmd['cmd'] == 'health':
+            return {'status': 'ready'}
+        
+        elif cmd['cmd'] == 'connect':
+            # Add connection to agent
+            success = await self.agent.mcp_client.add_connection(
+                cmd['target'],
+                cmd['endpoint']
+            )
             
-            else:
-                response = {'error': f"Unknown command: {cmd['cmd']}"}
+            # Update server if needed
+            if hasattr(self.agent.mcp_server, 'update_connections'):
+                connections = list(self.agent.mcp_client.connections.keys())
+                self.agent.mcp_server.update_connections(connections)
             
-            # Send response
-            writer.write(json.dumps(response).encode() + b'\n')
-            await writer.drain()
+            return {'status': 'connected' if success else 'failed'}
+        
+        elif cmd['cmd'] == 'shutdown':
+            # Trigger shutdown
+            if hasattr(self.agent, '_shutdown_event'):
+                self.agent._shutdown_event.set()
+            if self.shutdown_event:
+                self.shutdown_event.set()
             
-        except Exception as e:
-            # Send error
-            error_response = {'error': str(e)}
-            writer.write(json.dumps(error_response).encode() + b'\n')
+            # Schedule socket cleanup after response
+            asyncio.create_task(self._cleanup_socket())
+            return {'status': 'shutting_down'}
+        
+        elif cmd['cmd'] == 'metrics':
+            # Return metrics in requested format
+            format_type = cmd.get('format', 'json')
+            
+            if hasattr(self.agent, 'metrics_collector'):
+                if format_type == 'prometheus':
+                    metrics_text = self.agent.metrics_collector.get_metrics_prometheus()
+                    return {'metrics': metrics_text}
+                else:
+                    metrics_json = self.agent.metrics_collector.get_metrics_json()
+                    return {'metrics': metrics_json}
+            return {'error': 'Metrics not available'}
+        
+        return {'error': f"Unknown command: {cmd['cmd']}"}
+    
+    async def _stream_events(self, reader, writer):
+        """Stream agent events to a subscribed client until it disconnects."""
+        if not hasattr(self.agent, 'event_stream'):
+            writer.write(dumps({'error': 'Event stream not available'}) + b'\n')
             await writer.drain()
+            return
         
-        finally:
-            # Unsubscribe from events if subscribed
-            if hasattr(self, '_event_subscription') and self._event_subscription and hasattr(self.agent, 'event_stream'):
+        # Send initial response
+        writer.write(dumps({'status': 'subscribed'}) + b'\n')
+        await writer.drain()
+        
+        # Set up event forwarding
+        async def forward_event(event):
+            # Forward event to client
+            try:
+                # Encoded once and shared by every subscribed connection
+                writer.write(event.stream_frame())
+                await writer.drain()
+            except Exception as e:
+                # Connection closed, unsubscribe
+                self.logger.debug(f"Event forwarding error: {e}")
+                unsubscribe()
+        
+        # Subscribe to agent's event stream; the subscription belongs to this
+        # connection only and is dropped when it closes
+        unsubscribe = self.agent.event_stream.subscribe(forward_event)
+        self.logger.info(f"Subscribed to event stream for {self.agent.agent_id}, subscribers: {len(self.agent.event_stream.subscribers)}")
+        
+        # Events are sent by forward_event; keep reading until the client
+        # disconnects so drain requests can be answered
+        try:
+            while True:
+                data = await reader.readline()
+                if not data:
+                    break
+                
                 try:
-                    self.agent.event_stream.unsubscribe(self._event_subscription)
-                except:
-                    pass
-                self._event_subscription = None
+                    cmd = loads(data)
+                except ValueError:
+                    continue
                 
-            writer.close()
-            await writer.wait_closed()
+                if cmd.get('cmd') == 'drain':
+                    await self.agent.event_stream.flush(forward_event)
+                    writer.write(dumps({'status': 'drained'}) + b'\n')
+                    await writer.drain()
+        except (ConnectionResetError, BrokenPipeError):
+            # Client disconnected
+            pass
+        finally:
+            # Unsubscribe when connection closes
+            unsubscribe()
     
     async def _cleanup_socket(self):
         """Clean up socket file after shutdown."""
@@ -16,7 +16,7 @@
 import os
 import time
 from typing import Dict, Optional, List
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 from pathlib import Path
 import psutil
 
@@ -104,7 +104,7 @@ async def start_agent(self, agent_name: str, monitor_output: bool = True) -> boo
             cmd = [
                 sys.executable,
                 "-m", "agent_framework.network.agent_runner",
-                "--config", json.dumps(agent_proc.config.__dict__),
+                "--config", json.dumps(asdict(agent_proc.config)),
                 "--available-agents", ",".join(self.agents.keys())
             ]
             
@@ -482,21 +482,21 @@ async def connect(self, from_agent: str, to_agent: str, bidirectional: bool = Fa
         if to_agent not in self.agents or self.agents[to_agent].status != "running":
             raise ValueError(f"Agent {to_agent} is not running")
         
-        # Connect from_agent -> to_agent
-        success = await self.connection_manager.connect_agents(
-            from_agent, to_agent, self.agents
-        )
+        # Connect from_agent -> to_agent (and to_agent -> from_agent if
+        # bidirectional). The two directions go to different sockets, so
+        # run them concurrently.
+        pairs = [(from_agent, to_agent)]
+        if bidirectional:
+            pairs.append((to_agent, from_agent))
         
-        if not success:
-            raise RuntimeError(f"Failed to connect {from_agent} to {to_agent}")
+        results = await asyncio.gather(*[
+            self.connection_manager.connect_agents(src, dst, self.agents)
+            for src, dst in pairs
+        ])
         
-        # If bidirectional, also connect to_agent -> from_agent
-        if bidirectional:
-            success = await self.connection_manager.connect_agents(
-                to_agent, from_agent, self.agents
-            )
+        for (src, dst), success in zip(pairs, results):
             if not success:
-                raise RuntimeError(f"Failed to connect {to_agent} to {from_agent}")
+                raise RuntimeError(f"Failed to connect {src} to {dst}")
         
         self.logger.info(
             f"Connected {from_agent} {'<->' if bidirectional else '->'} {to_agent}"
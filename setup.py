@@ -25,7 +25,17 @@
         "openai": ["openai>=1.0.0"],
         "anthropic": ["anthropic>=0.15.0"],
         "google": ["google-generativeai>=0.3.0"],
-        "all": ["openai>=1.0.0", "anthropic>=0.15.0", "google-generativeai>=0.3.0"],
+        "fast": [
+            "orjson>=3.0", "inotify_simple>=1.3; sys_platform == 'linux'",
+            "watchfiles>=0.18; sys_platform != 'linux'",
+            "uvloop>=0.17; sys_platform != 'win32'",
+        ],
+        "all": [
+            "openai>=1.0.0", "anthropic>=0.15.0", "google-generativeai>=0.3.0",
+            "orjson>=3.0", "inotify_simple>=1.3; sys_platform == 'linux'",
+            "watchfiles>=0.18; sys_platform != 'linux'",
+            "uvloop>=0.17; sys_platform != 'win32'",
+        ],
     },
     entry_points={
         "console_scripts": [
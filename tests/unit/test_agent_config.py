@@ -1,5 +1,6 @@
 """Unit tests for AgentConfig."""
 
+import dataclasses
 import pytest
 from agent_framework.core.config import AgentConfig, load_config
 import tempfile
@@ -26,6 +27,23 @@ def test_agent_config_creation():
     assert config.external_mcp_servers == []  # default
 
 
+def test_agent_config_is_frozen():
+    """Test that AgentConfig can't be mutated, only replaced."""
+    config = AgentConfig(
+        name="test_agent",
+        llm_provider="openai",
+        llm_model="gpt-4",
+        role_prompt="Test agent",
+        port=8000
+    )
+    
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        config.port = 8001
+    
+    assert dataclasses.replace(config, port=8001).port == 8001
+    assert config.port == 8000
+
+
 def test_agent_config_direct_creation():
     """Test creating AgentConfig directly from parameters."""
     config = AgentConfig(
@@ -112,3 +130,125 @@ def test_config_validation():
             role_prompt="prompt",
             port=999  # Too low
         )
+
+
+def test_load_config_uses_parsed_cache(tmp_path, monkeypatch):
+    """Test that unchanged configs are served from the parsed-config cache."""
+    from agent_framework.core import config as config_module
+    
+    cache_dir = tmp_path / "cfgcache"
+    monkeypatch.setattr(config_module, "CONFIG_CACHE_DIR", cache_dir)
+    
+    config_path = tmp_path / "alice.yaml"
+    config_path.write_text("""
+agent:
+  name: alice
+  llm_provider: google
+  llm_model: gemini-1.5-pro
+  role_prompt: You are Alice
+  port: 8001
+""")
+    
+    first = load_config(str(config_path))
+    assert first.name == "alice"
+    assert len(list(cache_dir.glob("*.pkl"))) == 1
+    
+    # Second load must not touch YAML at all
+    def fail_load(*args, **kwargs):
+        raise AssertionError("YAML should not be parsed on a cache hit")
+    
+    monkeypatch.setattr(config_module.yaml, "load", fail_load)
+    second = load_config(str(config_path))
+    assert second == first
+    
+    # Bypassing the cache parses the file again
+    with pytest.raises(AssertionError):
+        load_config(str(config_path), use_cache=False)
+
+
+def test_load_config_memoized_until_modified(tmp_path, monkeypatch):
+    """Test that configs are memoized per process and invalidated by edits."""
+    from agent_framework.core import config as config_module
+    
+    monkeypatch.setattr(config_module, "CONFIG_CACHE_DIR", tmp_path / "cfgcache")
+    
+    config_path = tmp_path / "bob.yaml"
+    template = """
+agent:
+  name: bob
+  llm_provider: openai
+  llm_model: gpt-4
+  role_prompt: You are Bob
+  port: {port}
+"""
+    config_path.write_text(template.format(port=8002))
+    
+    first = load_config(str(config_path))
+    assert load_config(str(config_path)) is first
+    
+    # Rewrite with a different mtime - the cached entry must not be reused
+    config_path.write_text(template.format(port=8003))
+    stat = config_path.stat()
+    os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    
+    assert load_config(str(config_path)).port == 8003
+
+
+def test_load_config_size_change_invalidates(tmp_path, monkeypatch):
+    """Test that an edit keeping the same mtime is caught by the size."""
+    from agent_framework.core import config as config_module
+    
+    monkeypatch.setattr(config_module, "CONFIG_CACHE_DIR", tmp_path / "cfgcache")
+    
+    config_path = tmp_path / "carol.yaml"
+    template = """
+agent:
+  name: carol
+  llm_provider: openai
+  llm_model: gpt-4
+  role_prompt: {prompt}
+  port: 8004
+"""
+    config_path.write_text(template.format(prompt="You are Carol"))
+    mtime_ns = config_path.stat().st_mtime_ns
+    load_config(str(config_path))
+    
+    config_path.write_text(template.format(prompt="You are Carol, a critic"))
+    os.utime(config_path, ns=(mtime_ns, mtime_ns))
+    
+    assert load_config(str(config_path)).role_prompt == "You are Carol, a critic"
+
+
+def test_load_config_ignores_incompatible_cache_entry(tmp_path, monkeypatch):
+    """Test that a cache entry of another shape is a miss, not a broken config."""
+    import pickle
+    from pathlib import Path
+    from agent_framework.core import config as config_module
+    
+    monkeypatch.setattr(config_module, "CONFIG_CACHE_DIR", tmp_path / "cfgcache")
+    
+    config_path = tmp_path / "dave.yaml"
+    config_path.write_text("""
+agent:
+  name: dave
+  llm_provider: openai
+  llm_model: gpt-4
+  role_prompt: You are Dave
+  port: 8005
+""")
+    st = config_path.stat()
+    cache_path = config_module._config_cache_path(
+        Path(str(config_path.absolute())), st.st_mtime_ns, st.st_size
+    )
+    cache_path.parent.mkdir(parents=True)
+    cache_path.write_bytes(pickle.dumps({"name": "dave", "retired_field": True}))
+    
+    config = load_config(str(config_path))
+    assert config.role_prompt == "You are Dave"
+    assert config.port == 8005
+
+
+def test_load_config_missing_file(tmp_path):
+    """Test loading a config that doesn't exist."""
+    with pytest.raises(FileNotFoundError, match="Configuration file not found"):
+        load_config(str(tmp_path / "missing.yaml"))
@@ -0,0 +1,116 @@
+"""Unit tests for Agent tool-call dispatch."""
+
+import asyncio
+import json
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from agent_framework.core.agent import Agent
+from agent_framework.core.llm import ToolCall
+
+
+@pytest.fixture
+def agent():
+    """An Agent with mocked MCP client, skipping LLM/server setup."""
+    agent = Agent.__new__(Agent)
+    agent.mcp_client = AsyncMock()
+    agent.logger = MagicMock()
+    agent._tool_routes = {}
+    return agent
+
+
+@pytest.mark.asyncio
+async def test_tool_calls_run_concurrently_in_order(agent):
+    """Test that tool calls overlap and results keep the call order."""
+    running = 0
+    peak = 0
+    
+    async def communicate_with_agent(target_agent, message):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return {"agent": target_agent, "response": message}
+    
+    agent.mcp_client.communicate_with_agent.side_effect = communicate_with_agent
+    agent.mcp_client.call_tool.return_value = {"ok": True}
+    
+    results = await agent.handle_tool_calls([
+        ToolCall("communicate_with_bob", {"message": "hi"}, id="1"),
+        ToolCall("communicate_with_carol", {"message": "yo"}, id="2"),
+        ToolCall("weather.lookup", {"city": "Oslo"}, id="3"),
+        ToolCall("mystery", {}, id="4"),
+    ])
+    
+    assert peak == 2
+    assert results == [
+        {"tool_call_id": "1", "result": {"agent": "bob", "response": "hi"}},
+        {"tool_call_id": "2", "result": {"agent": "carol", "response": "yo"}},
+        {"tool_call_id": "3", "result": {"ok": True}},
+        {"tool_call_id": "4", "result": {"error": "Unknown tool: mystery"}},
+    ]
+    agent.mcp_client.call_tool.assert_awaited_once_with(
+        server_name="weather", tool_name="lookup", arguments={"city": "Oslo"}
+    )
+
+
+@pytest.mark.asyncio
+async def test_failed_tool_call_becomes_error_result(agent):
+    """Test that one failing call is reported without losing the others."""
+    agent.mcp_client.communicate_with_agent.side_effect = ConnectionError("bob is down")
+    agent.mcp_client.call_tool.return_value = {"ok": True}
+    
+    results = await agent.handle_tool_calls([
+        ToolCall("communicate_with_bob", {"message": "hi"}, id="1"),
+        ToolCall("weather.lookup", {}, id="2"),
+    ])
+    
+    assert results == [
+        {"tool_call_id": "1", "result": {"error": "bob is down"}},
+        {"tool_call_id": "2", "result": {"ok": True}},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_think_and_act_sends_tool_results_as_json(agent):
+    """Test that tool results go back to the LLM as JSON text."""
+    first = MagicMock(reasoning=None, content="asking bob")
+    first.tool_calls = [ToolCall("communicate_with_bob", {"message": "hi"}, id="1")]
+    agent.llm = AsyncMock()
+    agent.llm.complete.side_effect = [first, MagicMock(content="done")]
+    agent.mcp_server = MagicMock(get_system_prompt=MagicMock(return_value="sys"))
+    agent.mcp_server.get_agent_tools = AsyncMock(return_value=[])
+    agent.mcp_client.communicate_with_agent.return_value = {"response": "hello", "ok": True}
+    
+    assert await agent.think_and_act("greet bob") == "done"
+    
+    messages = agent.llm.complete.await_args.args[0]
+    assert messages[0] == {"role": "system", "content": "sys"}
+    assert messages[-1]["role"] == "tool"
+    prefix, payload = messages[-1]["content"].split(": ", 1)
+    assert prefix == "Tool result"
+    assert json.loads(payload) == {"response": "hello", "ok": True}
+
+
+@pytest.mark.asyncio
+async def test_think_and_act_encodes_non_str_keys(agent):
+    """Test that tool results with int keys are still sent as JSON."""
+    first = MagicMock(reasoning=None, content="looking up")
+    first.tool_calls = [
+        ToolCall("weather.lookup", {}, id="1"),
+        ToolCall("weather.grid", {}, id="2"),
+    ]
+    agent.llm = AsyncMock()
+    agent.llm.complete.side_effect = [first, MagicMock(content="done")]
+    agent.mcp_server = MagicMock(get_system_prompt=MagicMock(return_value="sys"))
+    agent.mcp_server.get_agent_tools = AsyncMock(return_value=[])
+    agent.mcp_client.call_tool.side_effect = [{1: "sunny", 2: "rain"}, {(0, 0): "sunny"}]
+    
+    assert await agent.think_and_act("forecast") == "done"
+    
+    messages = agent.llm.complete.await_args.args[0]
+    by_int = messages[-2]["content"].split(": ", 1)[1]
+    assert json.loads(by_int) == {"1": "sunny", "2": "rain"}
+    # Keys JSON can't represent fall back to the result's repr
+    assert messages[-1]["content"] == "Tool result: {(0, 0): 'sunny'}"
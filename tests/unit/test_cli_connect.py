@@ -62,7 +62,7 @@ def test_connect_socket_not_found(runner, mock_state):
     """Test connect when socket doesn't exist."""
     with patch('agent_framework.cli.commands.load_state', return_value=mock_state):
         with patch('agent_framework.cli.commands.save_state'):
-            with patch('os.path.exists', return_value=False):
+            with patch('asyncio.open_unix_connection', side_effect=FileNotFoundError):
                 result = runner.invoke(cli, ['connect', 'alice', 'bob'])
                 assert result.exit_code == 0
                 assert "Socket not found" in result.output
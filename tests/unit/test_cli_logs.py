@@ -0,0 +1,102 @@
+"""Unit tests for the CLI log tailing helpers."""
+
+import os
+
+import pytest
+
+from agent_framework.cli.commands import _indexed_tail_lines, _tail_lines, _watch_log_file
+
+
+@pytest.fixture
+def log_file(tmp_path):
+    """Create a log file with numbered lines."""
+    path = tmp_path / "agent.log"
+    path.write_text("".join(f"line {i}\n" for i in range(100)))
+    return path
+
+
+def test_tail_last_lines(log_file):
+    """Test reading the last N lines across small blocks."""
+    assert _tail_lines(log_file, 3, block_size=7) == ["line 97", "line 98", "line 99"]
+
+
+def test_tail_more_than_file(log_file):
+    """Test asking for more lines than the file has."""
+    lines = _tail_lines(log_file, 500, block_size=16)
+    assert len(lines) == 100
+    assert lines[0] == "line 0"
+    assert lines[-1] == "line 99"
+
+
+def test_tail_without_trailing_newline(tmp_path):
+    """Test a file whose last line is not terminated."""
+    path = tmp_path / "agent.log"
+    path.write_text("first\nsecond\nthird")
+    assert _tail_lines(path, 2, block_size=4) == ["second", "third"]
+
+
+def test_tail_with_needle(tmp_path):
+    """Test that only matching lines are kept and counted."""
+    path = tmp_path / "supervisor.log"
+    path.write_text("".join(
+        f"[{'alice' if i % 3 == 0 else 'bob'}] message {i}\n" for i in range(30)
+    ))
+    lines = _tail_lines(path, 2, needle=b"[alice]", block_size=10)
+    assert lines == ["[alice] message 24", "[alice] message 27"]
+
+
+def test_tail_empty_and_zero(tmp_path):
+    """Test empty files and non-positive line counts."""
+    path = tmp_path / "empty.log"
+    path.write_text("")
+    assert _tail_lines(path, 5) == []
+    path.write_text("data\n")
+    assert _tail_lines(path, 0) == []
+
+
+def test_indexed_tail_scans_only_appended_lines(tmp_path):
+    """Test that the sidecar index is extended, and rebuilt after truncation."""
+    path = tmp_path / "supervisor.log"
+    path.write_text("".join(
+        f"[{'alice' if i % 3 == 0 else 'bob'}] message {i}\n" for i in range(30)
+    ))
+    assert _indexed_tail_lines(path, 2, "alice") == ["[alice] message 24", "[alice] message 27"]
+    assert (tmp_path / ".supervisor.log.alice.idx").exists()
+    
+    with open(path, "a") as f:
+        f.write("[alice] message 30\n[bob] message 31\n[alice] partial")
+    assert _indexed_tail_lines(path, 3, "alice") == [
+        "[alice] message 27", "[alice] message 30", "[alice] partial"
+    ]
+    
+    path.write_text("[bob] fresh\n[alice] fresh\n")
+    assert _indexed_tail_lines(path, 5, "alice") == ["[alice] fresh"]
+
+
+def test_indexed_tail_ignores_torn_index(tmp_path):
+    """Test that an index whose body doesn't match its header is rebuilt."""
+    path = tmp_path / "supervisor.log"
+    path.write_text("".join(f"[alice] message {i}\n" for i in range(10)))
+    assert _indexed_tail_lines(path, 1, "alice") == ["[alice] message 9"]
+    
+    index_file = tmp_path / ".supervisor.log.alice.idx"
+    data = index_file.read_bytes()
+    index_file.write_bytes(data[:-12])  # Cut off mid-offset
+    
+    assert _indexed_tail_lines(path, 2, "alice") == ["[alice] message 8", "[alice] message 9"]
+    assert index_file.read_bytes() == data
+    assert list(tmp_path.glob("*.tmp")) == []
+
+
+def test_watcher_wakes_when_open_log_is_unlinked(log_file):
+    """Test that unlinking a followed log wakes the watcher promptly."""
+    pytest.importorskip("inotify_simple")
+    watcher = _watch_log_file(log_file)
+    try:
+        with open(log_file, 'rb'):
+            # The open handle keeps DELETE_SELF from firing
+            os.unlink(log_file)
+            log_file.write_text("new file\n")
+            assert watcher.read()
+    finally:
+        watcher.close()
@@ -0,0 +1,213 @@
+"""Unit tests for CLI state file handling."""
+
+import subprocess
+
+import pytest
+from click.testing import CliRunner
+
+from agent_framework.cli import commands
+
+
+@pytest.fixture
+def state_file(tmp_path, monkeypatch):
+    """Point the CLI state file at a temporary directory."""
+    path = tmp_path / "agents.json"
+    monkeypatch.setattr(commands, "STATE_FILE", path)
+    monkeypatch.setattr(commands, "STATE_LOCK_FILE", path.with_suffix(".lock"))
+    return path
+
+
+def test_load_state_missing_file(state_file):
+    """Test that a missing state file yields empty state."""
+    assert commands.load_state() == {"agents": {}}
+
+
+def test_save_state_round_trip(state_file):
+    """Test saving and reloading state leaves no temp file behind."""
+    state = {"agents": {"alice": {"pid": 1234, "port": 8001, "status": "running"}}}
+    commands.save_state(state)
+    
+    assert commands.load_state() == state
+    assert [p.name for p in state_file.parent.iterdir() if p.name.endswith(".tmp")] == []
+
+
+def test_state_lock_can_be_retaken(state_file):
+    """Test that the lock can be taken and released repeatedly."""
+    with commands.state_lock():
+        commands.save_state({"agents": {}})
+    with commands.state_lock():
+        assert commands.load_state() == {"agents": {}}
+
+
+def test_remove_saves_state(state_file):
+    """Test that a mutating command persists its changes."""
+    commands.save_state({"agents": {"alice": {"pid": 1, "port": 8001, "status": "stopped"}}})
+    
+    result = CliRunner().invoke(commands.cli, ["remove", "--stopped"], obj={})
+    
+    assert result.exit_code == 0
+    assert "Removed 1 agent(s)" in result.output
+    assert commands.load_state() == {"agents": {}}
+
+
+def test_status_skips_save_when_unchanged(state_file, monkeypatch):
+    """Test that status doesn't rewrite state if no agent changed status."""
+    # PID 0 never shows up as a live agent, so the agent stays 'stopped'
+    commands.save_state({"agents": {"alice": {"pid": 0, "port": 8001, "status": "stopped"}}})
+    monkeypatch.setattr(commands, "_live_pids", lambda: set())
+    
+    saved = []
+    monkeypatch.setattr(commands, "save_state", saved.append)
+    
+    result = CliRunner().invoke(commands.cli, ["status"], obj={})
+    
+    assert result.exit_code == 0
+    assert "stopped" in result.output
+    assert saved == []
+
+
+def test_status_probes_without_lock_and_keeps_concurrent_changes(state_file, monkeypatch):
+    """Test that status only locks to merge its changes into the file."""
+    fcntl = pytest.importorskip("fcntl")
+    commands.save_state({"agents": {"alice": {"pid": 0, "port": 8001, "status": "starting"}}})
+    monkeypatch.setattr(commands, "_live_pids", lambda: set())
+    
+    async def probe(name, timeout):
+        # Another agentctl can lock and update the state mid-probe
+        with open(state_file.with_suffix(".lock"), 'a') as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            fcntl.flock(lock, fcntl.LOCK_UN)
+        state = commands.load_state()
+        state["agents"]["alice"]["port"] = 9001
+        state["agents"]["bob"] = {"pid": 2, "port": 8002, "status": "running"}
+        commands.save_state(state)
+        return {}
+    
+    monkeypatch.setattr(commands, "_cached_health", probe)
+    
+    result = CliRunner().invoke(commands.cli, ["status"], obj={})
+    
+    assert result.exit_code == 0, result.output
+    assert commands.load_state() == {"agents": {
+        "alice": {"pid": 0, "port": 9001, "status": "failed"},
+        "bob": {"pid": 2, "port": 8002, "status": "running"},
+    }}
+
+
+def test_stop_unknown_agent_skips_save(state_file, monkeypatch):
+    """Test that stop doesn't rewrite state when nothing was stopped."""
+    commands.save_state({"agents": {}})
+    
+    saved = []
+    monkeypatch.setattr(commands, "save_state", saved.append)
+    
+    result = CliRunner().invoke(commands.cli, ["stop", "ghost"], obj={})
+    
+    assert result.exit_code == 0
+    assert "not found" in result.output
+    assert saved == []
+
+
+def test_cleanup_signals_only_tracked_agents(state_file, monkeypatch):
+    """Test that exit cleanup only signals verified PIDs from state."""
+    commands.save_state({"agents": {
+        "alice": {"pid": 1111, "port": 8001, "status": "running"},
+        "bob": {"pid": 2222, "port": 8002, "status": "running"},
+    }})
+    monkeypatch.setattr(commands, "_is_agent_process", lambda pid: pid == 1111)
+    
+    killed = []
+    monkeypatch.setattr(commands.os, "kill", lambda pid, sig: killed.append(pid))
+    
+    commands.cleanup_agents_on_exit()
+    
+    assert killed == [1111]
+
+
+def test_restart_unknown_agent_skips_save(state_file, monkeypatch):
+    """Test that restart doesn't rewrite state when nothing was restarted."""
+    commands.save_state({"agents": {}})
+    
+    saved = []
+    monkeypatch.setattr(commands, "save_state", saved.append)
+    
+    result = CliRunner().invoke(commands.cli, ["restart", "ghost"], obj={})
+    
+    assert result.exit_code == 0
+    assert "not found" in result.output
+    assert saved == []
+
+
+def test_restart_shares_one_supervisor(state_file, monkeypatch):
+    """Test that restarting several agents waits once and uses one supervisor."""
+    from types import SimpleNamespace
+    from agent_framework.core import config as config_module
+    from agent_framework.network import supervisor as supervisor_module
+    
+    commands.save_state({"agents": {
+        "alice": {"pid": 1111, "config_file": "alice.yaml"},
+        "bob": {"pid": 2222, "config_file": "bob.yaml"},
+    }})
+    
+    waits = []
+    supervisors = []
+    
+    class FakeSupervisor:
+        def __init__(self):
+            self.agents = {}
+            supervisors.append(self)
+        
+        def add_agent(self, config):
+            self.agents[config.name] = SimpleNamespace(status="stopped", pid=None)
+        
+        async def start_agent(self, name, monitor_output=True):
+            self.agents[name].status = "running"
+            self.agents[name].pid = {"alice": 3333, "bob": 4444}[name]
+            return True
+    
+    monkeypatch.setattr(commands.os, "kill", lambda pid, sig: None)
+    monkeypatch.setattr(commands, "_wait_for_exit", lambda pids: waits.append(pids) or [])
+    monkeypatch.setattr(config_module, "load_config",
+                        lambda path: SimpleNamespace(name=path.split(".")[0]))
+    monkeypatch.setattr(supervisor_module, "AgentSupervisor", FakeSupervisor)
+    
+    result = CliRunner().invoke(commands.cli, ["restart"], obj={})
+    
+    assert result.exit_code == 0, result.output
+    assert waits == [[1111, 2222]]
+    assert len(supervisors) == 1
+    assert {n: a["pid"] for n, a in commands.load_state()["agents"].items()} == {
+        "alice": 3333, "bob": 4444
+    }
+
+
+def test_wait_for_exit_reports_stragglers():
+    """Test that waiting returns only the processes still running."""
+    quick = subprocess.Popen(["sleep", "0.1"])
+    slow = subprocess.Popen(["sleep", "10"])
+    try:
+        assert commands._wait_for_exit([quick.pid, slow.pid], timeout=0.5) == [slow.pid]
+    finally:
+        slow.kill()
+        slow.wait()
+        quick.wait()
+
+
+@pytest.mark.asyncio
+async def test_cached_health_reuses_recent_result(monkeypatch):
+    """Test that health replies are reused within the TTL and re-probed with ttl=0."""
+    calls = []
+    
+    async def fake_health_check(name, timeout=5.0):
+        calls.append(name)
+        return {"status": "ready"}
+    
+    monkeypatch.setattr(commands.AgentSocketClient, "health_check", fake_health_check)
+    monkeypatch.setattr(commands, "_health_cache", {})
+    
+    assert await commands._cached_health("alice", timeout=1.0) == {"status": "ready"}
+    assert await commands._cached_health("alice", timeout=1.0) == {"status": "ready"}
+    assert calls == ["alice"]
+    
+    await commands._cached_health("alice", timeout=1.0, ttl=0)
+    assert calls == ["alice", "alice"]
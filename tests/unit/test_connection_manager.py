@@ -1,5 +1,6 @@
 """Unit tests for ConnectionManager."""
 
+import json
 import pytest
 from unittest.mock import MagicMock, AsyncMock, patch
 from agent_framework.network.connection_manager import ConnectionManager
@@ -79,9 +80,10 @@ async def test_connect_agents_via_socket():
             # Verify correct command was sent
             mock_writer.write.assert_called_once()
             sent_data = mock_writer.write.call_args[0][0]
-            assert b'"cmd": "connect"' in sent_data
-            assert b'"target": "bob"' in sent_data
-            assert b'"endpoint": "http://localhost:8002/mcp"' in sent_data
+            sent_cmd = json.loads(sent_data)
+            assert sent_cmd["cmd"] == "connect"
+            assert sent_cmd["target"] == "bob"
+            assert sent_cmd["endpoint"] == "http://localhost:8002/mcp"
 
 
 
@@ -6,8 +6,10 @@
 import tempfile
 import pytest
 import pytest_asyncio
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
+from agent_framework.client.socket_client import AgentSocketClient
+from agent_framework.core.events import EventStream, EventType
 from agent_framework.network.control_socket import AgentControlSocket
 
 
@@ -74,6 +76,73 @@ async def test_health_command(socket_server):
     await writer.wait_closed()
 
 
+@pytest.mark.asyncio
+async def test_multiple_commands_per_connection(socket_server):
+    """Test that one connection can carry several commands."""
+    control, socket_path = socket_server
+    
+    reader, writer = await asyncio.open_unix_connection(socket_path)
+    
+    for _ in range(3):
+        writer.write(json.dumps({'cmd': 'health'}).encode() + b'\n')
+        await writer.drain()
+        response = await reader.readline()
+        assert json.loads(response.decode())['status'] == 'ready'
+    
+    writer.close()
+    await writer.wait_closed()
+
+
+@pytest.mark.asyncio
+async def test_pipelined_commands_echo_ids(socket_server):
+    """Test that pipelined commands are each answered with their id."""
+    control, socket_path = socket_server
+    
+    reader, writer = await asyncio.open_unix_connection(socket_path)
+    
+    writer.write(b'{"cmd": "health", "id": 1}\n{"cmd": "bogus", "id": 2}\n')
+    await writer.drain()
+    
+    replies = [json.loads(await reader.readline()) for _ in range(2)]
+    by_id = {reply.pop('id'): reply for reply in replies}
+    assert by_id[1] == {'status': 'ready'}
+    assert 'error' in by_id[2]
+    
+    writer.close()
+    await writer.wait_closed()
+
+
+@pytest.mark.asyncio
+async def test_health_not_blocked_by_slow_connect(socket_server, mock_agent):
+    """Test that a pipelined health check is answered while a connect is pending."""
+    control, socket_path = socket_server
+    release = asyncio.Event()
+    
+    async def slow_add_connection(target, endpoint):
+        await release.wait()
+        return True
+    
+    mock_agent.mcp_client.add_connection.side_effect = slow_add_connection
+    mock_agent.mcp_client.connections = {'bob': 'connection'}
+    
+    reader, writer = await asyncio.open_unix_connection(socket_path)
+    writer.write(
+        b'{"cmd": "connect", "target": "bob", "endpoint": "http://localhost:8002/mcp", "id": 1}\n'
+        b'{"cmd": "health", "id": 2}\n'
+    )
+    await writer.drain()
+    
+    first = json.loads(await asyncio.wait_for(reader.readline(), timeout=1.0))
+    assert first == {'status': 'ready', 'id': 2}
+    
+    release.set()
+    second = json.loads(await asyncio.wait_for(reader.readline(), timeout=1.0))
+    assert second == {'status': 'connected', 'id': 1}
+    
+    writer.close()
+    await writer.wait_closed()
+
+
 @pytest.mark.asyncio
 async def test_connect_command(socket_server, mock_agent):
     """Test connect command."""
@@ -203,3 +272,63 @@ async def test_multiple_connections(socket_server):
         
         writer.close()
         await writer.wait_closed()
+
+
+@pytest.mark.asyncio
+async def test_drain_flushes_queued_events(socket_server, mock_agent):
+    """Test that drain returns only after queued events reach the subscriber."""
+    control, socket_path = socket_server
+    mock_agent.agent_id = "alice"
+    mock_agent.event_stream = EventStream("alice")
+    seen = []
+    
+    async def handler(event):
+        seen.append(event['data']['n'])
+    
+    with patch('agent_framework.client.socket_client._socket_path', return_value=socket_path):
+        subscription = await AgentSocketClient.subscribe_events("alice", handler)
+    
+    while not mock_agent.event_stream.subscribers:
+        await asyncio.sleep(0.01)
+    for n in range(5):
+        await mock_agent.event_stream.emit(EventType.LLM_REASONING, {"n": n})
+    
+    assert await subscription.drain(timeout=5.0)
+    assert seen == [0, 1, 2, 3, 4]
+    
+    subscription.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await subscription
+    await mock_agent.event_stream.close()
+
+
+@pytest.mark.asyncio
+async def test_closing_other_connection_keeps_event_subscription(socket_server, mock_agent):
+    """Test that closing a command connection doesn't drop another's subscription."""
+    control, socket_path = socket_server
+    mock_agent.agent_id = "alice"
+    mock_agent.event_stream = EventStream("alice")
+    
+    sub_reader, sub_writer = await asyncio.open_unix_connection(socket_path)
+    sub_writer.write(json.dumps({'cmd': 'subscribe_events'}).encode() + b'\n')
+    await sub_writer.drain()
+    assert json.loads(await sub_reader.readline())['status'] == 'subscribed'
+    
+    reader, writer = await asyncio.open_unix_connection(socket_path)
+    writer.write(json.dumps({'cmd': 'health'}).encode() + b'\n')
+    await writer.drain()
+    await reader.readline()
+    writer.close()
+    await writer.wait_closed()
+    await asyncio.sleep(0.05)  # Let the server finish closing it
+    
+    assert len(mock_agent.event_stream.subscribers) == 1
+    await mock_agent.event_stream.emit(EventType.LLM_REASONING, {"n": 1})
+    frame = await asyncio.wait_for(sub_reader.readline(), timeout=5.0)
+    assert json.loads(frame)['event']['data'] == {"n": 1}
+    
+    sub_writer.close()
+    await sub_writer.wait_closed()
+    await asyncio.sleep(0.05)
+    assert mock_agent.event_stream.subscribers == ()
+    await mock_agent.event_stream.close()
@@ -0,0 +1,156 @@
+"""Unit tests for the agent event stream."""
+
+import asyncio
+import json
+from datetime import datetime, timezone
+import pytest
+
+from agent_framework.core.events import AgentEvent, EventStream, EventType
+
+
+@pytest.mark.asyncio
+async def test_emit_delivers_in_order_to_all_subscribers():
+    """Test that every subscriber sees every event, in emission order."""
+    stream = EventStream("alice")
+    seen_async, seen_sync = [], []
+    
+    async def async_subscriber(event):
+        await asyncio.sleep(0)
+        seen_async.append(event.data["n"])
+    
+    stream.subscribe(async_subscriber)
+    stream.subscribe(lambda event: seen_sync.append(event.data["n"]))
+    
+    for n in range(5):
+        await stream.emit(EventType.LLM_REASONING, {"n": n})
+    await stream.close()
+    
+    assert seen_async == [0, 1, 2, 3, 4]
+    assert seen_sync == [0, 1, 2, 3, 4]
+    assert len(stream.get_history()) == 5
+    assert [e.data["n"] for e in stream.get_history(limit=2)] == [3, 4]
+    assert len(stream.get_history(limit=50)) == 5
+    assert len(stream.get_history(limit=0)) == 5
+    with pytest.raises(ValueError):
+        stream.get_history(limit=-1)
+
+
+@pytest.mark.asyncio
+async def test_failing_subscriber_does_not_block_others():
+    """Test that one subscriber raising doesn't stop delivery to the rest."""
+    stream = EventStream("alice")
+    seen = []
+    
+    def broken(event):
+        raise RuntimeError("boom")
+    
+    stream.subscribe(broken)
+    stream.subscribe(lambda event: seen.append(event.event_type))
+    
+    await stream.emit(EventType.ERROR, {})
+    await stream.close()
+    
+    assert seen == [EventType.ERROR]
+
+
+@pytest.mark.asyncio
+async def test_unsubscribe_stops_delivery():
+    """Test both the returned unsubscribe function and unsubscribe()."""
+    stream = EventStream("alice")
+    first, second = [], []
+    
+    def first_subscriber(event):
+        first.append(event)
+    
+    stop_second = stream.subscribe(lambda event: second.append(event))
+    stream.subscribe(first_subscriber)
+    
+    stream.unsubscribe(first_subscriber)
+    stop_second()
+    
+    await stream.emit(EventType.AGENT_STARTED, {})
+    await stream.close()
+    
+    assert first == [] and second == []
+    assert stream.subscribers == ()
+
+
+@pytest.mark.asyncio
+async def test_unsubscribe_bound_method():
+    """Test that a bound method can be unsubscribed via a fresh reference."""
+    
+    class Listener:
+        def __init__(self):
+            self.seen = []
+        
+        def handle(self, event):
+            self.seen.append(event)
+    
+    stream = EventStream("alice")
+    listener = Listener()
+    stream.subscribe(listener.handle)
+    await stream.emit(EventType.AGENT_STARTED, {})
+    await stream.flush(listener.handle)
+    
+    stream.unsubscribe(listener.handle)
+    await stream.emit(EventType.AGENT_STOPPED, {})
+    await stream.close()
+    
+    assert [e.event_type for e in listener.seen] == [EventType.AGENT_STARTED]
+    assert stream.subscribers == ()
+
+
+def test_event_serialization():
+    """Test the JSON forms of an event and that the stream frame is reused."""
+    event = AgentEvent(
+        timestamp=datetime(2025, 1, 1, tzinfo=timezone.utc).timestamp(),
+        agent_id="alice",
+        event_type=EventType.TOOL_CALL_MAKING,
+        data={"tool": "communicate_with_bob"}
+    )
+    
+    assert json.loads(event.to_json()) == {
+        "timestamp": "2025-01-01T00:00:00+00:00",
+        "agent_id": "alice",
+        "event_type": "tool_call_making",
+        "data": {"tool": "communicate_with_bob"},
+        "correlation_id": None
+    }
+    
+    frame = event.stream_frame()
+    assert frame.endswith(b"\n")
+    assert json.loads(frame)["event"]["type"] == "tool_call_making"
+    assert event.stream_frame() is frame
+    assert event.dt == datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+@pytest.mark.asyncio
+async def test_slow_subscriber_overflow_drops_newest():
+    """Test that a full subscriber queue drops events without affecting others."""
+    stream = EventStream("alice", subscriber_queue_size=4)
+    release = asyncio.Event()
+    slow, fast = [], []
+    
+    async def slow_subscriber(event):
+        await release.wait()
+        slow.append(event.data["n"])
+    
+    stream.subscribe(slow_subscriber)
+    stream.subscribe(lambda event: fast.append(event.data["n"]))
+    
+    for n in range(10):
+        await stream.emit(EventType.LLM_REASONING, {"n": n})
+        await asyncio.sleep(0)  # Let the delivery tasks run
+    release.set()
+    await stream.close()
+    
+    # The slow subscriber holds event 0 and has 1-4 queued; 5-9 are dropped
+    assert slow == [0, 1, 2, 3, 4]
+    assert fast == list(range(10))
+    assert stream.dropped_events == 5
+
+
+def test_unknown_overflow_policy():
+    """Test that an unknown overflow policy is rejected."""
+    with pytest.raises(ValueError):
+        EventStream("alice", overflow="spill")
@@ -0,0 +1,34 @@
+"""Unit tests for the universal agent MCP server."""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from agent_framework.mcp.server_universal import UniversalAgentMCPServer
+
+
+@pytest.mark.asyncio
+async def test_llm_inputs_cached_until_connections_change():
+    """Test that the system prompt and tools are rebuilt only after update_connections."""
+    mcp_client = AsyncMock()
+    mcp_client.get_available_agent_tools.return_value = ["communicate_with_bob"]
+    server = UniversalAgentMCPServer(
+        agent_id="alice",
+        agent_role="tester",
+        llm_provider=MagicMock(),
+        event_stream=MagicMock(),
+        logger=MagicMock(),
+        mcp_client=mcp_client
+    )
+    
+    server.update_connections(["bob"])
+    prompt = server.get_system_prompt()
+    assert "bob" in prompt
+    assert server.get_system_prompt() is prompt
+    assert await server.get_agent_tools() == ["communicate_with_bob"]
+    await server.get_agent_tools()
+    assert mcp_client.get_available_agent_tools.await_count == 1
+    
+    server.update_connections(["bob", "carol"])
+    assert "carol" in server.get_system_prompt()
+    await server.get_agent_tools()
+    assert mcp_client.get_available_agent_tools.await_count == 2
@@ -7,7 +7,7 @@
 from unittest.mock import patch, MagicMock, AsyncMock
 import pytest
 
-from agent_framework.client.socket_client import AgentSocketClient
+from agent_framework.client.socket_client import AgentSocketClient, _EventStreamProtocol
 
 
 @pytest.mark.asyncio
@@ -27,13 +27,202 @@ async def test_send_command_success():
             assert result == {"status": "ok"}
             mock_writer.write.assert_called_once()
             mock_writer.drain.assert_called_once()
+            mock_writer.close.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_send_command_reuses_connection():
+    """Test that repeated commands share one pooled connection."""
+    mock_reader = AsyncMock()
+    mock_writer = MagicMock()
+    mock_writer.drain = AsyncMock()
+    mock_writer.wait_closed = AsyncMock()
+    mock_reader.readline.return_value = json.dumps({"status": "ok"}).encode() + b'\n'
+    
+    with patch('os.path.exists', return_value=True):
+        with patch('asyncio.open_unix_connection', return_value=(mock_reader, mock_writer)) as mock_open:
+            await AgentSocketClient.send_command("test_agent", {"cmd": "health"})
+            await AgentSocketClient.send_command("test_agent", {"cmd": "health"})
+            
+            assert mock_open.call_count == 1
+            assert mock_writer.write.call_count == 2
+            
+            await AgentSocketClient.close_all()
             mock_writer.close.assert_called_once()
 
 
+@pytest.mark.asyncio
+async def test_send_command_reopens_stale_connection():
+    """Test that a connection closed by the agent is reopened once."""
+    stale_reader = AsyncMock()
+    stale_reader.readline.side_effect = [json.dumps({"status": "ok"}).encode() + b'\n', b'']
+    fresh_reader = AsyncMock()
+    fresh_reader.readline.return_value = json.dumps({"status": "ready"}).encode() + b'\n'
+    writer = MagicMock()
+    writer.drain = AsyncMock()
+    writer.wait_closed = AsyncMock()
+    
+    with patch('os.path.exists', return_value=True):
+        with patch('asyncio.open_unix_connection',
+                   side_effect=[(stale_reader, writer), (fresh_reader, writer)]) as mock_open:
+            await AgentSocketClient.send_command("test_agent", {"cmd": "health"})
+            result = await AgentSocketClient.send_command("test_agent", {"cmd": "health"})
+            
+            assert result == {"status": "ready"}
+            assert mock_open.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_send_command_does_not_resend_unsafe_command():
+    """Test that a shutdown whose reply is lost is not sent a second time."""
+    reader = AsyncMock()
+    reader.readline.side_effect = [json.dumps({"status": "ready"}).encode() + b'\n', b'']
+    writer = MagicMock()
+    writer.drain = AsyncMock()
+    writer.wait_closed = AsyncMock()
+    
+    with patch('asyncio.open_unix_connection', return_value=(reader, writer)) as mock_open:
+        await AgentSocketClient.health_check("test_agent")
+        result = await AgentSocketClient.shutdown_agent("test_agent")
+    
+    assert "Failed to communicate with test_agent" in result["error"]
+    assert mock_open.call_count == 1
+    assert writer.write.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_send_command_resends_when_write_failed():
+    """Test that a command that never reached a stale connection is resent."""
+    stale_writer = MagicMock()
+    stale_writer.drain = AsyncMock(side_effect=[None, BrokenPipeError()])
+    stale_reader = AsyncMock()
+    stale_reader.readline.return_value = json.dumps({"status": "ready"}).encode() + b'\n'
+    fresh_writer = MagicMock()
+    fresh_writer.drain = AsyncMock()
+    fresh_reader = AsyncMock()
+    fresh_reader.readline.return_value = json.dumps({"status": "shutting_down"}).encode() + b'\n'
+    
+    with patch('asyncio.open_unix_connection',
+               side_effect=[(stale_reader, stale_writer), (fresh_reader, fresh_writer)]):
+        await AgentSocketClient.health_check("test_agent")
+        result = await AgentSocketClient.shutdown_agent("test_agent")
+    
+    assert result == {"status": "shutting_down"}
+    fresh_writer.write.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_connect_uses_its_own_connection():
+    """Test that a connect doesn't go over the pooled connection probes share."""
+    def connection(reply):
+        reader = AsyncMock()
+        reader.readline.return_value = json.dumps(reply).encode() + b'\n'
+        writer = MagicMock()
+        writer.drain = AsyncMock()
+        writer.wait_closed = AsyncMock()
+        return reader, writer
+    
+    pooled = connection({"status": "ready"})
+    dedicated = connection({"status": "connected"})
+    
+    with patch('asyncio.open_unix_connection', side_effect=[pooled, dedicated]) as mock_open:
+        await AgentSocketClient.health_check("test_agent")
+        result = await AgentSocketClient.connect_agents("test_agent", "bob", "http://localhost:8002/mcp")
+        await AgentSocketClient.health_check("test_agent")
+    
+    assert result == {"status": "connected"}
+    assert mock_open.call_count == 2
+    assert pooled[1].write.call_count == 2
+    dedicated[1].close.assert_called_once()
+    pooled[1].close.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_send_command_pipelines_by_id():
+    """Test that concurrent commands share a connection and match replies by id."""
+    reader = asyncio.StreamReader()
+    writer = MagicMock()
+    writer.drain = AsyncMock()
+    writer.wait_closed = AsyncMock()
+    
+    sent = []
+    
+    def answer_in_reverse(data):
+        sent.append(json.loads(data))
+        if len(sent) == 2:
+            for cmd in reversed(sent):
+                reader.feed_data(json.dumps({"status": cmd["cmd"], "id": cmd["id"]}).encode() + b'\n')
+    
+    writer.write.side_effect = answer_in_reverse
+    
+    with patch('asyncio.open_unix_connection', return_value=(reader, writer)):
+        results = await asyncio.gather(
+            AgentSocketClient.send_command("test_agent", {"cmd": "health"}),
+            AgentSocketClient.send_command("test_agent", {"cmd": "metrics"}),
+        )
+    
+    assert results == [{"status": "health"}, {"status": "metrics"}]
+    assert sent[0]["id"] != sent[1]["id"]
+
+
+@pytest.mark.asyncio
+async def test_reply_timeout_keeps_connection_for_other_requests():
+    """Test that one request timing out doesn't fail others on the connection."""
+    reader = asyncio.StreamReader()
+    writer = MagicMock()
+    writer.drain = AsyncMock()
+    writer.wait_closed = AsyncMock()
+    
+    def answer_health_late(data):
+        cmd = json.loads(data)
+        if cmd["cmd"] == "health":
+            # Reply after the other request has timed out; "slow" never replies
+            asyncio.get_running_loop().call_later(
+                0.2, reader.feed_data,
+                json.dumps({"status": "ready", "id": cmd["id"]}).encode() + b'\n'
+            )
+    
+    writer.write.side_effect = answer_health_late
+    
+    with patch('asyncio.open_unix_connection', return_value=(reader, writer)) as mock_open:
+        slow, health = await asyncio.gather(
+            AgentSocketClient.send_command("test_agent", {"cmd": "slow"}, timeout=0.05),
+            AgentSocketClient.health_check("test_agent", timeout=5.0),
+        )
+    
+    assert "Timeout" in slow["error"]
+    assert health == {"status": "ready"}
+    assert mock_open.call_count == 1
+    writer.close.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_request_id_added_to_empty_command():
+    """Test that the request id is encoded into the command, even an empty one."""
+    reader = AsyncMock()
+    reader.readline.return_value = json.dumps({"error": "bad command"}).encode() + b'\n'
+    writer = MagicMock()
+    writer.drain = AsyncMock()
+    
+    with patch('asyncio.open_unix_connection', return_value=(reader, writer)):
+        await AgentSocketClient.send_command("test_agent", {})
+    
+    sent = json.loads(writer.write.call_args[0][0])
+    assert list(sent) == ["id"]
+
+
 @pytest.mark.asyncio
 async def test_send_command_socket_not_found():
     """Test when socket doesn't exist."""
-    with patch('os.path.exists', return_value=False):
+    with patch('asyncio.open_unix_connection', side_effect=FileNotFoundError):
+        result = await AgentSocketClient.send_command("test_agent", {"cmd": "health"})
+        assert result == {"error": "Socket not found for agent test_agent"}
+
+
+@pytest.mark.asyncio
+async def test_send_command_connection_refused():
+    """Test a stale socket file with nothing listening on it."""
+    with patch('asyncio.open_unix_connection', side_effect=ConnectionRefusedError):
         result = await AgentSocketClient.send_command("test_agent", {"cmd": "health"})
         assert result == {"error": "Socket not found for agent test_agent"}
 
@@ -131,3 +320,28 @@ async def test_get_metrics():
             sent_data = mock_writer.write.call_args[0][0]
             sent_cmd = json.loads(sent_data.decode().strip())
             assert sent_cmd["format"] == "json"
+
+
+@pytest.mark.asyncio
+async def test_event_stream_protocol_splits_frames():
+    """Test that events split across reads, or larger than the buffer, are reassembled."""
+    protocol = _EventStreamProtocol(buffer_size=16)
+    
+    def feed(data: bytes):
+        while data:
+            buf = protocol.get_buffer(-1)
+            n = min(len(buf), len(data))
+            buf[:n] = data[:n]
+            protocol.buffer_updated(n)
+            data = data[n:]
+    
+    big = {"event": {"data": "x" * 100}}
+    feed(b'{"status":"subscribed"}\n{"event":')
+    feed(b'{"type":"a"}}\n' + json.dumps(big).encode() + b'\n')
+    protocol.connection_lost(None)
+    
+    messages = []
+    while not protocol.messages.empty():
+        messages.append(protocol.messages.get_nowait())
+    
+    assert messages == [{"status": "subscribed"}, {"event": {"type": "a"}}, big, None]
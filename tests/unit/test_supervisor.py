@@ -1,5 +1,6 @@
 """Unit tests for AgentSupervisor."""
 
+import json
 import pytest
 from unittest.mock import MagicMock, patch, AsyncMock, call
 import asyncio
@@ -285,7 +286,7 @@ async def test_socket_based_shutdown(test_config):
                     # Verify socket command was sent
                     mock_writer.write.assert_called()
                     sent_data = mock_writer.write.call_args[0][0]
-                    assert b'"cmd": "shutdown"' in sent_data
+                    assert json.loads(sent_data)["cmd"] == "shutdown"
                     
                     # Process should receive SIGTERM for clean shutdown
                     mock_kill.assert_called_once_with(12345, signal.SIGTERM)